@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+App Paths - Locations of the application's per-user data.
+
+Kept free of other project imports so low-level modules (e.g. OCR) can use it.
+"""
+import os
+import sys
+
+# Application name for AppData folder
+APP_NAME = "RoK Automation"
+
+
+def get_appdata_dir():
+    """Get the appropriate application data directory for the current OS."""
+    if sys.platform == "win32":
+        # Windows: Use %APPDATA%/RoK Automation
+        base = os.environ.get("APPDATA", os.path.expanduser("~"))
+    elif sys.platform == "darwin":
+        # macOS: Use ~/Library/Application Support/RoK Automation
+        base = os.path.join(os.path.expanduser("~"), "Library", "Application Support")
+    else:
+        # Linux/other: Use ~/.config/RoK Automation
+        base = os.environ.get("XDG_CONFIG_HOME", os.path.join(os.path.expanduser("~"), ".config"))
+
+    return os.path.join(base, APP_NAME)
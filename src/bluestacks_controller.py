@@ -1,10 +1,32 @@
 import os
+import sys
+import queue
 import subprocess
+import threading
 import time
 import logging
 import cv2
 import numpy as np
 
+# Echoed after each command in the persistent adb shell to detect completion
+SHELL_DONE_MARKER = "__rok_cmd_done__"
+
+# Keeps console windows from flashing up for helper processes run directly (without cmd.exe)
+NO_WINDOW_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
+# Longest a persistent-shell command (including sleeps inside input scripts) may take
+SHELL_COMMAND_TIMEOUT = 60
+
+
+def _read_shell_output(stdout, lines):
+    """Forward lines from the adb shell's stdout to a queue; None marks the end of output."""
+    try:
+        for line in stdout:
+            lines.put(line)
+    except (OSError, ValueError):
+        pass
+    lines.put(None)
+
 
 class BlueStacksController:
     """Controller for BlueStacks operations and interactions"""
@@ -18,15 +40,133 @@ class BlueStacksController:
         self.bluestacks_exe_path = bs_config.get('bluestacks_exe_path')
         self.bluestacks_instance_name = bs_config.get('bluestacks_instance_name')
         self.adb_path = bs_config.get('adb_path')
-        self.wait_for_startup_seconds = int(bs_config.get('wait_for_startup_seconds', 30))
+        self.wait_for_startup_seconds = config_manager.wait_for_startup_seconds
 
         # Default ADB device address
         self.adb_device = "127.0.0.1:5625"  # Default port, can be overridden
 
+        # Long-lived 'adb shell' process used for input commands, and the queue
+        # its stdout lines are read into (so reads can time out)
+        self._shell = None
+        self._shell_lines = None
+
+        # Incremented on every input command; screenshots taken at an older epoch are stale
+        self.frame_epoch = 0
+
     def set_adb_device(self, device_address):
         """Set the ADB device address (typically IP:PORT)"""
+        if device_address != self.adb_device:
+            self.close_shell()
         self.adb_device = device_address
 
+    def _get_shell(self):
+        """Get the persistent adb shell process, starting it if needed."""
+        if self._shell is None or self._shell.poll() is not None:
+            self._shell = subprocess.Popen(
+                [self.adb_path, "-s", self.adb_device, "shell"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                creationflags=NO_WINDOW_FLAGS
+            )
+            self._shell_lines = queue.Queue()
+            threading.Thread(target=_read_shell_output, args=(self._shell.stdout, self._shell_lines),
+                             daemon=True).start()
+        return self._shell
+
+    def close_shell(self):
+        """Terminate the persistent adb shell process, if any."""
+        if self._shell is None:
+            return
+
+        try:
+            if self._shell.poll() is None:
+                self._shell.stdin.close()
+                self._shell.terminate()
+                self._shell.wait(timeout=5)
+        except Exception as e:
+            self.logger.debug(f"Error closing adb shell: {e}")
+        finally:
+            self._shell = None
+            self._shell_lines = None
+
+    def shell_command(self, command):
+        """
+        Run a device shell input command and wait for it to finish.
+
+        Commands go through one long-lived 'adb shell' process, so each call
+        costs a pipe write instead of spawning adb.exe and reconnecting.
+        Falls back to a one-shot adb call if the shell cannot be used.
+
+        Args:
+            command: Shell command line to run on the device
+
+        Returns:
+            bool: True if the command completed, False otherwise
+        """
+        self.frame_epoch += 1
+        return self._run_shell(command)
+
+    def _run_shell(self, command):
+        """Run a device shell command on the persistent shell without touching frame_epoch."""
+        return self._shell_output(command) is not None
+
+    def _shell_output(self, command, timeout=SHELL_COMMAND_TIMEOUT):
+        """
+        Run a device shell command on the persistent shell and collect its output.
+
+        Only a command that could not be written to the shell at all is retried
+        with a one-shot adb call. Once written, it may already have run (partly,
+        for a multi-step input script), so a shell that dies or stops answering
+        within the timeout fails the call instead of replaying the taps.
+
+        Args:
+            command: Shell command line to run on the device
+            timeout: Seconds to wait for the command to finish
+
+        Returns:
+            str or None: The command's output, or None if it failed or timed out
+        """
+        try:
+            shell = self._get_shell()
+            lines = self._shell_lines
+            shell.stdin.write(f"{command}; echo {SHELL_DONE_MARKER}\n")
+            shell.stdin.flush()
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Persistent adb shell failed: {e}")
+            self.close_shell()
+
+            # Nothing reached the device, so a one-shot adb call is safe
+            result = subprocess.run([self.adb_path, "-s", self.adb_device, "shell", command],
+                                    capture_output=True, text=True, creationflags=NO_WINDOW_FLAGS)
+            return result.stdout if result.returncode == 0 else None
+
+        output = []
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self.logger.error(f"adb shell did not finish '{command}' within {timeout}s")
+                break
+
+            if line is None:
+                self.logger.error(f"adb shell exited while running '{command}'")
+                break
+
+            text = line.rstrip()
+            if text.endswith(SHELL_DONE_MARKER):
+                # Output without a trailing newline shares the marker's line
+                if text != SHELL_DONE_MARKER:
+                    output.append(text[:-len(SHELL_DONE_MARKER)])
+                return "\n".join(output)
+            output.append(text)
+
+        # The shell is wedged or gone; drop it so the next command starts a fresh one
+        self.close_shell()
+        return None
+
     def start_bluestacks(self):
         """Start BlueStacks with specified instance"""
         self.logger.info(f"Starting BlueStacks instance: {self.bluestacks_instance_name}")
@@ -36,8 +176,8 @@ class BlueStacksController:
                 self.logger.error(f"BlueStacks executable not found at: {self.bluestacks_exe_path}")
                 return False
 
-            cmd = f'"{self.bluestacks_exe_path}" --instance {self.bluestacks_instance_name}'
-            subprocess.Popen(cmd, shell=True)
+            subprocess.Popen([self.bluestacks_exe_path, "--instance", self.bluestacks_instance_name],
+                             creationflags=NO_WINDOW_FLAGS)
 
             self.logger.info(f"Waiting {self.wait_for_startup_seconds} seconds for BlueStacks to initialize...")
             time.sleep(self.wait_for_startup_seconds)
@@ -54,12 +194,12 @@ class BlueStacksController:
 
         try:
             # Connect to the device
-            connect_cmd = f'"{self.adb_path}" connect {self.adb_device}'
-            result = subprocess.run(connect_cmd, shell=True, capture_output=True, text=True)
+            subprocess.run([self.adb_path, "connect", self.adb_device],
+                           capture_output=True, text=True, creationflags=NO_WINDOW_FLAGS)
 
             # Verify connection
-            verify_cmd = f'"{self.adb_path}" devices'
-            verify_result = subprocess.run(verify_cmd, shell=True, capture_output=True, text=True)
+            verify_result = subprocess.run([self.adb_path, "devices"],
+                                           capture_output=True, text=True, creationflags=NO_WINDOW_FLAGS)
 
             if self.adb_device in verify_result.stdout:
                 self.logger.info(f"Successfully connected to ADB on device: {self.adb_device}")
@@ -72,6 +212,16 @@ class BlueStacksController:
             self.logger.error(f"Error connecting to ADB: {e}")
             return False
 
+    def is_app_running(self, package_name):
+        """Check if an app is running on the device (via pidof on the persistent shell)"""
+        output = self._shell_output(f"pidof {package_name}", timeout=10)
+        if output is None:
+            self.logger.error(f"Error checking if {package_name} is running")
+            # Assume it is running so a transient ADB error does not abort automation
+            return True
+
+        return bool(output.strip())
+
     def take_screenshot(self):
         """Take a screenshot of the BlueStacks window using ADB"""
         try:
@@ -85,12 +235,12 @@ class BlueStacksController:
                 os.remove(screenshot_path)
 
             # Take screenshot command
-            screenshot_cmd = f'"{self.adb_path}" -s {self.adb_device} shell screencap -p /sdcard/screenshot.png'
-            subprocess.run(screenshot_cmd, shell=True, capture_output=True)
+            # Capture on the persistent shell; not input, so frame_epoch is left alone
+            self._run_shell("screencap -p /sdcard/screenshot.png")
 
             # Pull screenshot to PC
-            pull_cmd = f'"{self.adb_path}" -s {self.adb_device} pull /sdcard/screenshot.png {screenshot_path}'
-            subprocess.run(pull_cmd, shell=True, capture_output=True)
+            subprocess.run([self.adb_path, "-s", self.adb_device, "pull", "/sdcard/screenshot.png", screenshot_path],
+                           capture_output=True, creationflags=NO_WINDOW_FLAGS)
 
             # Check if screenshot was saved
             if not os.path.exists(screenshot_path):
@@ -114,8 +264,7 @@ class BlueStacksController:
         """Click at specific coordinates"""
         try:
             # Use ADB to simulate tap
-            tap_cmd = f'"{self.adb_path}" -s {self.adb_device} shell input tap {x} {y}'
-            result = subprocess.run(tap_cmd, shell=True, capture_output=True)
+            self.shell_command(f"input tap {x} {y}")
 
             # Add delay after click
             time.sleep(delay_ms / 1000)
@@ -126,12 +275,76 @@ class BlueStacksController:
             self.logger.error(f"Error clicking at ({x}, {y}): {e}")
             return False
 
+    def click_sequence(self, taps):
+        """
+        Click a sequence of coordinates using a single ADB shell command.
+
+        Spawning adb.exe dominates the cost of a single tap, so the taps and
+        the waits between them are run as one device-side shell command.
+
+        Args:
+            taps: List of (x, y, wait_seconds) tuples; wait_seconds is the pause after each tap
+
+        Returns:
+            bool: True if the sequence was sent successfully, False otherwise
+        """
+        if not taps:
+            return True
+
+        try:
+            steps = []
+            for x, y, wait_seconds in taps[:-1]:
+                steps.append(f"input tap {x} {y}")
+                steps.append(f"sleep {wait_seconds:g}")
+            last_x, last_y, last_wait = taps[-1]
+            steps.append(f"input tap {last_x} {last_y}")
+
+            success = self.execute_script("; ".join(steps))
+
+            # Final wait happens locally so the caller regains control afterwards
+            time.sleep(last_wait)
+
+            return success
+
+        except Exception as e:
+            self.logger.error(f"Error running click sequence {taps}: {e}")
+            return False
+
+    def click_burst(self, x, y, times, delay_ms=500):
+        """
+        Tap the same coordinates repeatedly using a single ADB shell command.
+
+        Args:
+            x, y: Coordinates to tap
+            times: Number of taps
+            delay_ms: Delay after each tap in milliseconds
+
+        Returns:
+            bool: True if the burst was sent successfully, False otherwise
+        """
+        return self.click_sequence([(x, y, delay_ms / 1000)] * times)
+
+    def execute_script(self, script):
+        """
+        Run a multi-step input script (e.g. swipes and taps separated by sleeps) in one go.
+
+        Args:
+            script: Device shell script, commands separated by ';'
+
+        Returns:
+            bool: True if the script completed, False otherwise
+        """
+        try:
+            return self.shell_command(script)
+        except Exception as e:
+            self.logger.error(f"Error running input script '{script}': {e}")
+            return False
+
     def swipe(self, start_x, start_y, end_x, end_y, duration_ms=500):
         """Swipe from one point to another"""
         try:
             # Use ADB to simulate swipe
-            swipe_cmd = f'"{self.adb_path}" -s {self.adb_device} shell input swipe {start_x} {start_y} {end_x} {end_y} {duration_ms}'
-            result = subprocess.run(swipe_cmd, shell=True, capture_output=True)
+            self.shell_command(f"input swipe {start_x} {start_y} {end_x} {end_y} {duration_ms}")
 
             # Add delay after swipe
             time.sleep(0.5)
@@ -142,12 +355,33 @@ class BlueStacksController:
             self.logger.error(f"Error swiping from ({start_x}, {start_y}) to ({end_x}, {end_y}): {e}")
             return False
 
+    def send_escape_n(self, count, delay_ms=500):
+        """
+        Send the escape (back) key several times using a single ADB shell command.
+
+        Args:
+            count: Number of key presses
+            delay_ms: Delay after each key press in milliseconds
+
+        Returns:
+            bool: True if the key presses were sent successfully, False otherwise
+        """
+        if count <= 0:
+            return True
+
+        delay_seconds = delay_ms / 1000
+        script = f"; sleep {delay_seconds:g}; ".join(["input keyevent 4"] * count)
+        success = self.execute_script(script)
+
+        # Final wait happens locally so the caller regains control afterwards
+        time.sleep(delay_seconds)
+        return success
+
     def send_escape(self):
         """Send escape key (back button in Android)"""
         try:
             # Use ADB to send back button keyevent
-            key_cmd = f'"{self.adb_path}" -s {self.adb_device} shell input keyevent 4'
-            result = subprocess.run(key_cmd, shell=True, capture_output=True)
+            self.shell_command("input keyevent 4")
 
             # Add delay after key press
             time.sleep(0.5)
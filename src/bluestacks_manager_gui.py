@@ -25,7 +25,7 @@ class StopAutomationException(Exception):
 from config_manager import ConfigManager
 from bluestacks_controller import BlueStacksController
 from rok_game_controller import RoKGameController
-from instance_manager import InstanceManager
+from instance_manager import get_instance_manager
 from instance_manager_gui import InstanceManagerDialog
 from daily_task_tracker import DailyTaskTracker, get_tracker_path_for_instance
 
@@ -70,7 +70,7 @@ class CollapsibleFrame(ttk.Frame):
 
 
 class RiseOfKingdomsManagerGUI:
-    def __init__(self, root):
+    def __init__(self, root, instance_manager=None):
         self.root = root
         self.root.title("RoK Auto Bot")
         self.root.geometry("550x750")
@@ -80,8 +80,8 @@ class RiseOfKingdomsManagerGUI:
         # Set up logging
         self.setup_logging()
 
-        # Initialize instance manager
-        self.instance_manager = InstanceManager()
+        # Initialize instance manager (main() may have built it in the background)
+        self.instance_manager = instance_manager or get_instance_manager()
 
         # Get current instance
         self.current_instance = self.instance_manager.get_current_instance()
@@ -572,25 +572,24 @@ class RiseOfKingdomsManagerGUI:
     def save_configuration(self, show_message=False):
         """Save current configuration to config.ini"""
         try:
-            config = self.config_manager.config
+            config = self.config_manager
 
-            config['BlueStacks']['bluestacks_exe_path'] = self.bluestacks_path.get()
-            config['BlueStacks']['bluestacks_instance_name'] = self.instance_name.get()
-            config['BlueStacks']['adb_path'] = self.adb_path.get()
-            config['BlueStacks']['wait_for_startup_seconds'] = str(self.start_delay.get())
-            config['BlueStacks']['adb_port'] = self.adb_port.get()
+            config.set('BlueStacks', 'bluestacks_exe_path', self.bluestacks_path.get())
+            config.set('BlueStacks', 'bluestacks_instance_name', self.instance_name.get())
+            config.set('BlueStacks', 'adb_path', self.adb_path.get())
+            config.set('BlueStacks', 'wait_for_startup_seconds', str(self.start_delay.get()))
+            config.set('BlueStacks', 'adb_port', self.adb_port.get())
 
             version = self.rok_version.get()
-            config['RiseOfKingdoms']['rok_version'] = version.lower()
-            config['RiseOfKingdoms']['package_name'] = self.rok_packages.get(version, self.rok_packages["Global"])
-            config['RiseOfKingdoms']['num_of_characters'] = str(self.character_count.get())
-            config['RiseOfKingdoms']['march_preset'] = str(self.march_preset.get())
-            config['RiseOfKingdoms']['perform_build'] = str(self.enable_troop_build.get())
-            config['RiseOfKingdoms']['perform_donation'] = str(self.enable_tech_donation.get())
-            config['RiseOfKingdoms']['perform_expedition'] = str(self.enable_expedition.get())
+            config.set('RiseOfKingdoms', 'rok_version', version.lower())
+            config.set('RiseOfKingdoms', 'package_name', self.rok_packages.get(version, self.rok_packages["Global"]))
+            config.set('RiseOfKingdoms', 'num_of_characters', str(self.character_count.get()))
+            config.set('RiseOfKingdoms', 'march_preset', str(self.march_preset.get()))
+            config.set('RiseOfKingdoms', 'perform_build', str(self.enable_troop_build.get()))
+            config.set('RiseOfKingdoms', 'perform_donation', str(self.enable_tech_donation.get()))
+            config.set('RiseOfKingdoms', 'perform_expedition', str(self.enable_expedition.get()))
 
-            with open(self.config_manager.config_path, 'w') as configfile:
-                config.write(configfile)
+            config.save_config()
 
             self.log("Configuration saved", "success")
 
@@ -685,13 +684,15 @@ class RiseOfKingdomsManagerGUI:
 
     def wait_in_intervals(self):
         """Wait in smaller intervals to allow for stopping"""
-        total_wait = self.rok_controller.game_load_wait_seconds
+        deadline = time.monotonic() + self.rok_controller.game_load_wait_seconds
         interval = 2
-        for _ in range(0, total_wait, interval):
+        while True:
             if self.stop_requested:
                 raise StopAutomationException("Automation stopped by user")
-            time.sleep(min(interval, total_wait))
-            total_wait -= interval
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(interval, remaining))
 
     def _run_automation(self):
         """Run the complete automation sequence in a separate thread"""
@@ -802,6 +803,11 @@ class RiseOfKingdomsManagerGUI:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
         finally:
+            # Save text positions learned during this run
+            if self.rok_controller:
+                self.rok_controller.ocr.flush_disk_cache()
+            if self.bluestacks_controller:
+                self.bluestacks_controller.close_shell()
             self.is_running = False
             self.root.after(0, self.reset_ui_after_automation)
 
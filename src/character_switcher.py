@@ -8,11 +8,20 @@ Includes recovery and graceful degradation for failed characters.
 """
 import time
 import logging
-import numpy as np
 
 from recovery_manager import RetryConfig, with_retry
 from daily_task_tracker import DailyTaskTracker
 
+# Seconds to let the character list settle after each scroll before the next input
+SCROLL_SETTLE_SECONDS = 4
+
+# Failure handling: pause after this many failures in a row, and give up
+# once more than MAX_FAILURE_RATE of at least MIN_CHARS_FOR_FAILURE_RATE characters failed
+MAX_CONSECUTIVE_FAILURES = 2
+DEGRADED_PAUSE_SECONDS = 30
+MAX_FAILURE_RATE = 0.5
+MIN_CHARS_FOR_FAILURE_RATE = 4
+
 
 class CharacterSwitcher:
     """Automates character switching workflow with recovery support."""
@@ -22,7 +31,8 @@ class CharacterSwitcher:
                  character_login_loading_time=3, game_load_wait_seconds=30,
                  will_perform_build=True, will_perform_donation=True, will_perform_expedition=True,
                  stop_check_callback=None, navigate_to_map_callback=None,
-                 daily_task_tracker=None, force_daily_tasks=False):
+                 daily_task_tracker=None, force_daily_tasks=False,
+                 game_running_callback=None):
         """
         Initialize the character switcher.
 
@@ -46,6 +56,7 @@ class CharacterSwitcher:
             navigate_to_map_callback: Optional callback to navigate to map
             daily_task_tracker: Optional DailyTaskTracker for tracking daily task completion
             force_daily_tasks: If True, run daily tasks even if already completed today
+            game_running_callback: Optional callback returning whether the game process is alive
         """
         self.logger = logging.getLogger(__name__)
         self.bluestacks = bluestacks
@@ -74,6 +85,7 @@ class CharacterSwitcher:
         # Callbacks
         self.stop_check = stop_check_callback
         self.navigate_to_map = navigate_to_map_callback
+        self.is_game_running = game_running_callback
 
         # Navigation coordinates
         self.avatar_icon = coords.get_nav('avatar_icon')
@@ -81,9 +93,32 @@ class CharacterSwitcher:
         self.characters_icon = coords.get_nav('characters_icon')
         self.yes_button = coords.get_nav('yes_button')
 
+        # Avatar icon -> settings icon -> characters icon as (x, y, wait_seconds) taps.
+        # Waits include the per-click delay plus time for each menu to appear.
+        click_delay = click_delay_ms / 1000
+        self._selection_taps = [
+            (self.avatar_icon['x'], self.avatar_icon['y'], click_delay + 3),  # Wait for profile menu
+            (self.settings_icon['x'], self.settings_icon['y'], click_delay + 2),
+            (self.characters_icon['x'], self.characters_icon['y'], click_delay + 6),
+        ]
+
+        # Character list scroll as (start_x, start_y, end_x, end_y, duration_ms)
+        scroll = coords.get_scroll('character_list')
+        self._scroll = (scroll['start']['x'], scroll['start']['y'],
+                        scroll['end']['x'], scroll['end']['y'], scroll['duration_ms'])
+
         # Character grid positions
         self.character_positions_first_rotation = coords.get_character_grid('first_rotation')
         self.character_positions_after_scroll = coords.get_character_grid('after_scroll')
+        # Grid per rotation (page), indexed by index // 6: first page, then after-scroll pages
+        max_rotation = max(1, -(-self.num_of_chars // 6))
+        self._rotation_table = (
+            [self.character_positions_first_rotation]
+            + [self.character_positions_after_scroll] * (max_rotation - 1)
+        )
+
+        # Click plan for the whole run, filled by plan_character_positions()
+        self._position_plan = []
 
     def check_stop_requested(self):
         """Check if automation should stop."""
@@ -164,7 +199,7 @@ class CharacterSwitcher:
 
             if is_loading:
                 loading_detected = True
-                self.logger.info(f"Loading screen detected, waiting... ({elapsed}s)")
+                self.logger.info("Loading screen detected, waiting... (%ss)", elapsed)
             elif loading_detected:
                 # Loading screen was visible but now it's gone - game finished loading
                 self.logger.info("Loading screen finished, waiting 3s for game to initialize...")
@@ -179,7 +214,7 @@ class CharacterSwitcher:
             elapsed += check_interval
 
         # Max wait reached - proceed anyway
-        self.logger.info(f"Max wait time ({max_wait}s) reached, proceeding...")
+        self.logger.info("Max wait time (%ss) reached, proceeding...", max_wait)
         time.sleep(3)  # Still wait 3s buffer
         return True
 
@@ -190,12 +225,8 @@ class CharacterSwitcher:
 
         self.logger.info("Scrolling down character list")
 
-        scroll = self.coords.get_scroll('character_list')
-        start = scroll['start']
-        end = scroll['end']
-        duration = scroll['duration_ms']
-
-        if not self.bluestacks.swipe(start['x'], start['y'], end['x'], end['y'], duration):
+        start_x, start_y, end_x, end_y, duration = self._scroll
+        if not self.bluestacks.swipe(start_x, start_y, end_x, end_y, duration):
             self.logger.error("Failed to scroll down")
             return False
 
@@ -209,35 +240,15 @@ class CharacterSwitcher:
 
         self.logger.info("Opening character selection screen")
 
-        # Click avatar icon in top left
-        self.logger.info("Clicking avatar icon")
-        if not self.bluestacks.click(self.avatar_icon['x'], self.avatar_icon['y'], self.click_delay_ms):
-            self.logger.error("Failed to click avatar icon")
-            return False
-
-        time.sleep(3)  # Increased wait for profile menu to appear
-
-        if self.check_stop_requested():
-            return False
-
-        # Click settings icon
-        self.logger.info("Clicking settings icon")
-        if not self.bluestacks.click(self.settings_icon['x'], self.settings_icon['y'], self.click_delay_ms):
-            self.logger.error("Failed to click settings icon")
-            return False
-
-        time.sleep(2)
-
-        if self.check_stop_requested():
-            return False
-
-        # Click characters icon
-        self.logger.info("Clicking characters icon")
-        if not self.bluestacks.click(self.characters_icon['x'], self.characters_icon['y'], self.click_delay_ms):
-            self.logger.error("Failed to click characters icon")
-            return False
+        # Avatar, settings and characters icons, checking for a stop after each menu opens
+        self.logger.info("Clicking avatar, settings and characters icons")
+        for tap in self._selection_taps:
+            if not self.bluestacks.click_sequence([tap]):
+                self.logger.error("Failed to open character selection screen")
+                return False
 
-        time.sleep(6)
+            if self.check_stop_requested():
+                return False
 
         self.logger.info("Character selection screen opened")
         return True
@@ -252,17 +263,33 @@ class CharacterSwitcher:
         Returns:
             dict: Position {x, y} for the character
         """
-        # Calculate which rotation (page) we're on
-        rotation = int(np.ceil((index + 1) / 6))
+        if index < len(self._position_plan):
+            return self._position_plan[index]
 
-        # Calculate position within the current grid (0-5)
-        pos_idx = index % 6
+        # Rotation (page) and position within the grid (0-5)
+        rotation_idx = index // 6
+        if rotation_idx < len(self._rotation_table):
+            return self._rotation_table[rotation_idx][index % 6]
 
-        # Choose position based on rotation
-        if rotation == 1:
-            return self.character_positions_first_rotation[pos_idx]
-        else:
-            return self.character_positions_after_scroll[pos_idx]
+        # Beyond the configured character count - any later page uses the after-scroll grid
+        return self.character_positions_after_scroll[index % 6]
+
+    def plan_character_positions(self, num_chars):
+        """
+        Precompute click positions for the first num_chars characters.
+
+        The plan is built once per run so per-character lookups become a
+        plain list index.
+
+        Args:
+            num_chars: Number of characters to plan for
+
+        Returns:
+            list: Position {x, y} per character index
+        """
+        self._position_plan = []  # Clear so positions are computed from the grid
+        self._position_plan = [self.get_character_position(i) for i in range(num_chars)]
+        return self._position_plan
 
     def navigate_to_character(self, index):
         """
@@ -277,26 +304,31 @@ class CharacterSwitcher:
         if self.check_stop_requested():
             return False
 
-        # Calculate which rotation (page) we need
-        rotation = int(np.ceil((index + 1) / 6))
-        pos_idx = index % 6
+        # Number of scrolls needed to reach the character's page (rotation - 1)
+        scroll_count = index // 6
         pos = self.get_character_position(index)
-        self.logger.info(f"Character index: {index}, rotation: {rotation}, pos_idx: {pos_idx}")
-        self.logger.info(f"Will click at position: ({pos['x']}, {pos['y']})")
+        self.logger.debug("Character index: %d, rotation: %d, pos_idx: %d", index, scroll_count + 1, index % 6)
+        self.logger.info("Will click at position: (%s, %s)", pos['x'], pos['y'])
 
-        # Scroll to the correct page
-        for _ in range(1, rotation):
-            if self.check_stop_requested():
+        if scroll_count == 0:
+            if not self.bluestacks.click(pos['x'], pos['y'], self.click_delay_ms):
+                self.logger.error("Failed to click character at position %s", pos)
                 return False
-            self.scroll_down()
-            time.sleep(2)
+            return True
 
-        # Get position and click
-        pos = self.get_character_position(index)
-        if not self.bluestacks.click(pos['x'], pos['y'], self.click_delay_ms):
-            self.logger.error(f"Failed to click character at position {pos}")
+        # Scroll to the correct page and click, sent as one batched ADB script.
+        # Each scroll waits as long as scroll_down() plus the settle time used between pages.
+        self.logger.info("Scrolling down character list %d time(s)", scroll_count)
+        start_x, start_y, end_x, end_y, duration = self._scroll
+        swipe = f"input swipe {start_x} {start_y} {end_x} {end_y} {duration}"
+        steps = [f"{swipe}; sleep {SCROLL_SETTLE_SECONDS:g}"] * scroll_count
+        steps.append(f"input tap {pos['x']} {pos['y']}")
+
+        if not self.bluestacks.execute_script("; ".join(steps)):
+            self.logger.error("Failed to scroll to and click character at position %s", pos)
             return False
 
+        time.sleep(self.click_delay_ms / 1000)
         return True
 
     def confirm_character_switch(self):
@@ -306,19 +338,20 @@ class CharacterSwitcher:
         Returns:
             bool: True if successful, False otherwise
         """
-        self.logger.info(f"Waiting {self.character_login_loading_time}s for character login screen...")
-        time.sleep(self.character_login_loading_time)
+        # Poll for the character login screen instead of sleeping the full loading time
+        self.logger.info("Waiting up to %ss for character login screen...", self.character_login_loading_time)
+        is_login_screen = self.screen.wait_for(self.screen.is_in_character_login,
+                                               self.character_login_loading_time)
 
         if self.check_stop_requested():
             return False
 
-        # Check if this screen is now character login screen
-        is_login_screen = self.screen.is_in_character_login()
-        self.logger.info(f"is_in_character_login() returned: {is_login_screen}")
+        self.logger.debug("is_in_character_login() returned: %s", is_login_screen)
 
         if is_login_screen:
             # Click the "Yes" button to confirm character switch
-            self.logger.info(f"Character login dialog detected! Clicking Yes at ({self.yes_button['x']}, {self.yes_button['y']})")
+            self.logger.info("Character login dialog detected! Clicking Yes at (%s, %s)",
+                             self.yes_button['x'], self.yes_button['y'])
             if not self.bluestacks.click(self.yes_button['x'], self.yes_button['y'], self.click_delay_ms):
                 self.logger.error("Failed to click Yes to character login")
                 return False
@@ -332,8 +365,9 @@ class CharacterSwitcher:
             # Character being selected is already the current one
             # WARNING: This could mean click landed on wrong position or current character
             self.logger.warning(
-                f"No character login dialog detected for character {self.current_character_index + 1}. "
-                f"This character may have been SKIPPED! Click might have hit current character or empty space."
+                "No character login dialog detected for character %d. "
+                "This character may have been SKIPPED! Click might have hit current character or empty space.",
+                self.current_character_index + 1
             )
             self.logger.info("Returning to main screen with 3 escape keys...")
             for _ in range(3):
@@ -362,12 +396,12 @@ class CharacterSwitcher:
         # Perform build automation (DAILY TASK)
         if self.will_perform_build:
             if self.should_run_daily_task(DailyTaskTracker.TASK_BUILD):
-                self.logger.info(f"Performing build for character {char_display}")
+                self.logger.info("Performing build for character %d", char_display)
                 if self.build.perform_build(self.march_preset, navigate_to_map_callback=self.navigate_to_map):
                     self.mark_daily_task_completed(DailyTaskTracker.TASK_BUILD)
             else:
                 self.logger.info(
-                    f"Skipping build for character {char_display} - already completed today (UTC)"
+                    "Skipping build for character %d - already completed today (UTC)", char_display
                 )
 
         if self.check_stop_requested():
@@ -377,13 +411,13 @@ class CharacterSwitcher:
         # Done before donation so screen is in cleaner state for character switch
         if self.will_perform_expedition:
             if self.should_run_daily_task(DailyTaskTracker.TASK_EXPEDITION):
-                self.logger.info(f"Collecting expedition rewards for character {char_display}")
+                self.logger.info("Collecting expedition rewards for character %d", char_display)
                 time.sleep(1)
                 if self.expedition.perform_expedition_collection():
                     self.mark_daily_task_completed(DailyTaskTracker.TASK_EXPEDITION)
             else:
                 self.logger.info(
-                    f"Skipping expedition for character {char_display} - already completed today (UTC)"
+                    "Skipping expedition for character %d - already completed today (UTC)", char_display
                 )
 
         if self.check_stop_requested():
@@ -392,7 +426,7 @@ class CharacterSwitcher:
         # Perform donation automation (SCHEDULED TASK - runs every cycle)
         # Done last as it leaves screen in cleanest state for character switch
         if self.will_perform_donation:
-            self.logger.info(f"Performing Alliance Donation for character {char_display}")
+            self.logger.info("Performing Alliance Donation for character %d", char_display)
             time.sleep(1)
             self.donation.perform_recommended_tech_donation()
 
@@ -422,7 +456,7 @@ class CharacterSwitcher:
 
         # Navigate to and click the character
         if not self.navigate_to_character(index):
-            self.logger.error(f"Failed to navigate to character {index}")
+            self.logger.error("Failed to navigate to character %d", index)
             return False
 
         # Confirm switch or handle already-selected case
@@ -441,6 +475,28 @@ class CharacterSwitcher:
 
         return True
 
+    def _handle_consecutive_failures(self):
+        """
+        Pause after repeated failures and check the game is still alive.
+
+        Returns:
+            bool: True if processing should continue, False to abort the run
+        """
+        self.logger.warning(
+            "%d characters failed in a row, pausing %ds before continuing",
+            MAX_CONSECUTIVE_FAILURES, DEGRADED_PAUSE_SECONDS
+        )
+        for _ in range(DEGRADED_PAUSE_SECONDS):
+            if self.check_stop_requested():
+                return False
+            time.sleep(1)
+
+        if self.is_game_running and not self.is_game_running():
+            self.logger.error("Game is no longer running, aborting character switching")
+            return False
+
+        return True
+
     def switch_all_characters(self, start_from=0):
         """
         Main function to switch through all characters with graceful degradation.
@@ -455,44 +511,68 @@ class CharacterSwitcher:
             bool: True if all characters processed successfully, False if any failed
         """
         self.logger.info("Starting character switching process")
+        self.plan_character_positions(self.num_of_chars)
 
         successful_characters = 0
         failed_characters = []
+        consecutive_failures = 0
 
         for i in range(start_from, self.num_of_chars):
             if self.check_stop_requested():
                 self.logger.info("Automation stopped during character switching")
                 break
 
-            self.logger.info(f"Processing character {i + 1} of {self.num_of_chars}")
+            self.logger.info("Processing character %d of %d", i + 1, self.num_of_chars)
 
             try:
                 # Process this character with retry support
                 if self._process_single_character(i):
                     successful_characters += 1
+                    consecutive_failures = 0
                     pos = self.get_character_position(i)
-                    self.logger.info(f"Successfully completed character {i + 1} at position {pos}")
-                else:
-                    failed_characters.append(i + 1)  # 1-based for logging
-                    self.logger.warning(
-                        f"Character {i + 1} failed after retries, attempting recovery"
-                    )
-                    # Try to return to home before next character
-                    self.recovery.return_to_home(max_attempts=3)
+                    self.logger.info("Successfully completed character %d at position %s", i + 1, pos)
+                    continue
+
+                failed_characters.append(i + 1)  # 1-based for logging
+                self.logger.warning(
+                    "Character %d failed after retries, attempting recovery", i + 1
+                )
 
             except Exception as e:
                 failed_characters.append(i + 1)
-                self.logger.error(f"Exception processing character {i + 1}: {e}")
-                # Try to return to home before next character
-                self.recovery.return_to_home(max_attempts=3)
+                self.logger.error("Exception processing character %d: %s", i + 1, e)
+
+            consecutive_failures += 1
+
+            # Bail out early when most characters are failing - something is systemically wrong
+            processed = i + 1 - start_from
+            if (processed >= MIN_CHARS_FOR_FAILURE_RATE
+                    and len(failed_characters) / processed > MAX_FAILURE_RATE):
+                self.logger.error(
+                    "%d of %d characters failed, aborting character switching",
+                    len(failed_characters), processed
+                )
+                break
+
+            if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                if not self._handle_consecutive_failures():
+                    break
+                consecutive_failures = 0
+
+            # Try to return to home before next character
+            self.recovery.return_to_home(max_attempts=3)
+
+        # Write any pending daily task completions
+        if self.daily_tracker is not None:
+            self.daily_tracker.flush()
 
         # Report summary
         total = self.num_of_chars - start_from
         self.logger.info(
-            f"Character switching completed: {successful_characters}/{total} successful"
+            "Character switching completed: %d/%d successful", successful_characters, total
         )
 
         if failed_characters:
-            self.logger.warning(f"Failed characters: {failed_characters}")
+            self.logger.warning("Failed characters: %s", failed_characters)
 
         return len(failed_characters) == 0
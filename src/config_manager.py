@@ -1,8 +1,66 @@
 import os
 import sys
+import copy
+import json
 import logging
 import configparser
+import functools
 import string
+import tempfile
+
+# Auto-detected install paths are cached here so later starts skip the drive scan
+PATH_CACHE_FILE = "rok_bot_paths.json"
+
+# Most installs live on one of these, so they are probed before the rest of the alphabet
+PRIORITY_DRIVES = ["C", "D", "E"]
+
+
+def _get_path_cache_file():
+    """Get the location of the detected-paths cache file."""
+    base = os.environ.get("LOCALAPPDATA", tempfile.gettempdir())
+    return os.path.join(base, PATH_CACHE_FILE)
+
+
+def _load_path_cache():
+    """Load previously detected installation paths, or an empty dict."""
+    try:
+        with open(_get_path_cache_file(), 'r') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_path_cache(cache):
+    """Persist detected installation paths (best effort)."""
+    try:
+        with open(_get_path_cache_file(), 'w') as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _list_drives():
+    """
+    List mounted drive roots, most likely drives first.
+
+    On Windows a single GetLogicalDrives() call returns a bitmask of valid
+    drive letters, avoiding a stat per letter (which can wake sleeping drives).
+    """
+    if sys.platform != "win32":
+        return ("/",)
+
+    try:
+        import ctypes
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+        letters = [string.ascii_uppercase[i] for i in range(26) if mask & (1 << i)]
+    except (ImportError, AttributeError, OSError):
+        letters = [d for d in string.ascii_uppercase if os.path.exists(f"{d}:\\")]
+
+    ordered = [d for d in PRIORITY_DRIVES if d in letters]
+    ordered += [d for d in letters if d not in PRIORITY_DRIVES]
+    return tuple(f"{d}:\\" for d in ordered)
 
 
 def find_bluestacks_path():
@@ -10,17 +68,19 @@ def find_bluestacks_path():
     bluestacks_relative = "Program Files\\BlueStacks_nxt\\HD-Player.exe"
     adb_relative = "Program Files\\BlueStacks_nxt\\HD-Adb.exe"
 
-    # Get all available drives on Windows
-    if sys.platform == "win32":
-        drives = [f"{d}:\\" for d in string.ascii_uppercase if os.path.exists(f"{d}:\\")]
-    else:
-        drives = ["/"]
+    # Reuse the last detected location if it is still there
+    cache = _load_path_cache()
+    cached = cache.get("bluestacks")
+    if cached and os.path.exists(cached[0]):
+        return cached[0], cached[1]
 
     # Check each drive for BlueStacks
-    for drive in drives:
+    for drive in _list_drives():
         bs_path = os.path.join(drive, bluestacks_relative)
         adb_path = os.path.join(drive, adb_relative)
         if os.path.exists(bs_path):
+            cache["bluestacks"] = [bs_path, adb_path]
+            _save_path_cache(cache)
             return bs_path, adb_path
 
     # Default fallback
@@ -31,14 +91,19 @@ def find_tesseract_path():
     """Auto-detect Tesseract installation path across different drives."""
     tesseract_relative = "Program Files\\Tesseract-OCR\\tesseract.exe"
 
-    if sys.platform == "win32":
-        drives = [f"{d}:\\" for d in string.ascii_uppercase if os.path.exists(f"{d}:\\")]
-    else:
+    if sys.platform != "win32":
         return "/usr/bin/tesseract"
 
-    for drive in drives:
+    cache = _load_path_cache()
+    cached = cache.get("tesseract")
+    if cached and os.path.exists(cached):
+        return cached
+
+    for drive in _list_drives():
         tess_path = os.path.join(drive, tesseract_relative)
         if os.path.exists(tess_path):
+            cache["tesseract"] = tess_path
+            _save_path_cache(cache)
             return tess_path
 
     return "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
@@ -47,18 +112,92 @@ def find_tesseract_path():
 class ConfigManager:
     """Configuration manager for the application"""
 
-    def __init__(self, config_path="config.ini"):
+    def __init__(self, config_path="config.ini", create_default=True):
+        """
+        Load a configuration file.
+
+        Args:
+            config_path: Path to the ini file
+            create_default: Write a default config if the file is missing; when False,
+                a missing file raises FileNotFoundError instead
+        """
         self.logger = logging.getLogger(__name__)
         self.config_path = config_path
+        self.create_default = create_default
+        self._cache = {}
         self.config = self.load_config()
 
-        # Load and validate BlueStacks paths
-        self.validate_paths()
+        # BlueStacks paths are validated lazily on first get_bluestacks_config()
+        self._paths_validated = False
+
+        # Frequently used timing values, parsed once
+        self._parse_timing_values()
+
+    def _parse_timing_values(self):
+        """Parse hot-path timing values into typed attributes."""
+        self.click_delay_ms = int(self.get_navigation_config().get('click_delay_ms', 1000))
+        self.wait_for_startup_seconds = self.get_int('BlueStacks', 'wait_for_startup_seconds', 30)
+        self.game_load_wait_seconds = self.get_int('RiseOfKingdoms', 'game_load_wait_seconds', 30)
+
+    def reload(self):
+        """Re-read the configuration file and drop cached values."""
+        self.config = self.load_config()
+        self._paths_validated = False
+        self.invalidate_cache()
+
+    def copy(self):
+        """
+        Make an independent ConfigManager with the same settings, without reading the file.
+
+        Returns:
+            ConfigManager: Copy whose set() calls do not affect this manager
+        """
+        clone = copy.copy(self)
+        clone.config = configparser.ConfigParser()
+        clone.config.read_dict({section: dict(self.config.items(section, raw=True))
+                                for section in self.config.sections()})
+        clone._cache = dict(self._cache)
+        return clone
+
+    def invalidate_cache(self):
+        """Drop cached getter results (set(), save_config() and reload() call this)."""
+        self._cache.clear()
+        self._parse_timing_values()
+
+    def set(self, section, key, value):
+        """
+        Set a configuration value in memory; save_config() writes it to disk.
+
+        Args:
+            section: Config section, created if missing
+            key: Option name
+            value: Option value (string)
+        """
+        if not self.config.has_section(section):
+            self.config.add_section(section)
+        self.config[section][key] = value
+        self.invalidate_cache()
+
+    def save_config(self):
+        """Write the configuration to its ini file"""
+        with open(self.config_path, 'w') as configfile:
+            self.config.write(configfile)
+        self.invalidate_cache()
 
     def load_config(self):
         """Load configuration from ini file"""
+        self._cache.clear()
         config = configparser.ConfigParser()
 
+        # Existing config: a single read, no default construction or path detection
+        try:
+            with open(self.config_path, 'r') as configfile:
+                config.read_file(configfile)
+            return config
+        except FileNotFoundError:
+            if not self.create_default:
+                raise
+
         # Auto-detect installation paths
         bs_path, adb_path = find_bluestacks_path()
         tess_path = find_tesseract_path()
@@ -86,14 +225,11 @@ class ConfigManager:
             }
         }
 
-        # Create default config if not exists
-        if not os.path.exists(self.config_path):
-            self.logger.info(f"Creating default configuration at {self.config_path}")
-            config.read_dict(default_config)
-            with open(self.config_path, 'w') as configfile:
-                config.write(configfile)
-        else:
-            config.read(self.config_path)
+        # Create default config
+        self.logger.info(f"Creating default configuration at {self.config_path}")
+        config.read_dict(default_config)
+        with open(self.config_path, 'w') as configfile:
+            config.write(configfile)
 
         return config
 
@@ -113,14 +249,13 @@ class ConfigManager:
 
             if os.path.exists(detected_bs):
                 self.logger.info(f"Found BlueStacks at: {detected_bs}")
-                self.config['BlueStacks']['bluestacks_exe_path'] = detected_bs
-                self.config['BlueStacks']['adb_path'] = detected_adb
+                self.set('BlueStacks', 'bluestacks_exe_path', detected_bs)
+                self.set('BlueStacks', 'adb_path', detected_adb)
                 bluestacks_exe_path = detected_bs
                 adb_path = detected_adb
 
                 # Save the corrected config
-                with open(self.config_path, 'w') as configfile:
-                    self.config.write(configfile)
+                self.save_config()
                 self.logger.info("Config updated with detected paths")
             else:
                 self.logger.error("Could not auto-detect BlueStacks installation")
@@ -133,7 +268,10 @@ class ConfigManager:
             # Don't exit - let the UI show so user can fix it
 
     def get_bluestacks_config(self):
-        """Get BlueStacks configuration"""
+        """Get BlueStacks configuration, validating its paths on first access"""
+        if not self._paths_validated:
+            self._paths_validated = True
+            self.validate_paths()
         return self.config['BlueStacks']
 
     def get_rok_config(self):
@@ -157,28 +295,52 @@ class ConfigManager:
 
     def get_config(self, section, key, default=None):
         """Get a specific configuration value"""
+        cache_key = ('str', section, key, default)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
         try:
-            return self.config[section][key]
+            value = self.config[section][key]
         except (KeyError, configparser.NoSectionError):
-            return default
+            value = default
+        self._cache[cache_key] = value
+        return value
 
     def get_int(self, section, key, default=0):
         """Get configuration value as integer"""
+        cache_key = ('int', section, key, default)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
         try:
-            return int(self.config[section][key])
+            value = int(self.config[section][key])
         except (KeyError, ValueError, configparser.NoSectionError):
-            return default
+            value = default
+        self._cache[cache_key] = value
+        return value
 
     def get_float(self, section, key, default=0.0):
         """Get configuration value as float"""
+        cache_key = ('float', section, key, default)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
         try:
-            return float(self.config[section][key])
+            value = float(self.config[section][key])
         except (KeyError, ValueError, configparser.NoSectionError):
-            return default
+            value = default
+        self._cache[cache_key] = value
+        return value
 
     def get_bool(self, section, key, default=False):
         """Get configuration value as boolean"""
+        cache_key = ('bool', section, key, default)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
         try:
-            return self.config.getboolean(section, key)
+            value = self.config.getboolean(section, key)
         except (KeyError, ValueError, configparser.NoSectionError, configparser.NoOptionError):
-            return default
\ No newline at end of file
+            value = default
+        self._cache[cache_key] = value
+        return value
@@ -6,8 +6,77 @@ This module loads coordinates from coordinates.json and provides
 typed access methods for points, regions, and other coordinate data.
 """
 import os
+import sys
 import json
 import logging
+from collections import namedtuple
+from types import MappingProxyType
+import numpy as np
+from json_io import json_loads
+
+
+class _KeyAccess:
+    """Allow coordinate tuples to be read by field name, e.g. point['x']."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        if key not in self._fields:
+            return default
+        return getattr(self, key)
+
+
+class Point(_KeyAccess, namedtuple('Point', 'x y')):
+    """Immutable x, y screen coordinate."""
+
+    __slots__ = ()
+
+
+class Region(_KeyAccess, namedtuple('Region', 'x y width height')):
+    """Immutable x, y, width, height screen region."""
+
+    __slots__ = ()
+
+
+_POINT_KEYS = frozenset(Point._fields)
+_REGION_KEYS = frozenset(Region._fields)
+
+
+def _freeze_color_profile(profile):
+    """Convert HSV bound lists to read-only uint8 arrays ready for cv2.inRange."""
+    frozen = {}
+    for key, value in profile.items():
+        if key.startswith('hsv_'):
+            value = np.asarray(value, dtype=np.uint8)
+            value.flags.writeable = False
+        frozen[key] = value
+    return MappingProxyType(frozen)
+
+
+def _freeze(node):
+    """
+    Convert loaded JSON into Points, Regions and tuples so lookups need no copies.
+
+    Dict keys are interned so lookups with source-code literals (which Python
+    interns) match by identity instead of a full string compare.
+    """
+    if isinstance(node, dict):
+        keys = node.keys()
+        if keys == _POINT_KEYS:
+            return Point(**node)
+        if keys == _REGION_KEYS:
+            return Region(**node)
+        return {sys.intern(key): _freeze(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return tuple(_freeze(item) for item in node)
+    return node
 
 
 class CoordinateManager:
@@ -31,20 +100,29 @@ class CoordinateManager:
 
         self.config_path = config_path
         self.data = {}
+        self._flat = {}
+        self._raw_cache = {}
         self._load_coordinates()
 
     def _load_coordinates(self):
         """Load coordinates from JSON file."""
         try:
-            if not os.path.exists(self.config_path):
+            try:
+                with open(self.config_path, 'rb') as f:
+                    self.data = _freeze(json_loads(f.read()))
+            except FileNotFoundError:
                 self.logger.error(f"Coordinates file not found: {self.config_path}")
-                raise FileNotFoundError(f"Coordinates file not found: {self.config_path}")
+                raise FileNotFoundError(f"Coordinates file not found: {self.config_path}") from None
 
-            with open(self.config_path, 'r') as f:
-                self.data = json.load(f)
+            if 'color_detection' in self.data:
+                self.data['color_detection'] = {
+                    name: _freeze_color_profile(profile)
+                    for name, profile in self.data['color_detection'].items()
+                }
 
             self.logger.info(f"Loaded coordinates for resolution: {self.data.get('resolution', 'unknown')}")
             self._validate_required_keys()
+            self._build_flat_index()
 
         except json.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in coordinates file: {e}")
@@ -61,6 +139,21 @@ class CoordinateManager:
         if missing:
             self.logger.warning(f"Missing coordinate sections: {missing}")
 
+    def _build_flat_index(self):
+        """Index every named entry by (section, name) so getters need a single lookup."""
+        self._raw_cache = {}
+        self._flat = {
+            (section, name): value
+            for section, entries in self.data.items() if isinstance(entries, dict)
+            for name, value in entries.items()
+        }
+
+    def _missing(self, category, name):
+        """Build the KeyError for a failed (category, name) lookup."""
+        if category not in self.data:
+            return KeyError(f"Coordinate category not found: {category}")
+        return KeyError(f"Coordinate '{name}' not found in category '{category}'")
+
     def reload(self):
         """Reload coordinates from file (useful for hot-reloading during development)."""
         self._load_coordinates()
@@ -71,33 +164,36 @@ class CoordinateManager:
 
     def get_point(self, category, name):
         """
-        Get a point coordinate as a dict with x, y keys.
+        Get a point coordinate with x, y fields.
 
         Args:
             category: Category name (e.g., 'navigation', 'screen')
             name: Coordinate name within the category
 
         Returns:
-            dict: {'x': int, 'y': int}
+            Point: (x, y), also readable as point['x'] / point['y']
 
         Raises:
             KeyError: If category or name not found
         """
-        if category not in self.data:
-            raise KeyError(f"Coordinate category not found: {category}")
-
-        if name not in self.data[category]:
-            raise KeyError(f"Coordinate '{name}' not found in category '{category}'")
-
-        return self.data[category][name].copy()
+        try:
+            return self._flat[(category, name)]
+        except KeyError:
+            raise self._missing(category, name) from None
 
     def get_nav(self, name):
         """Shorthand for get_point('navigation', name)."""
-        return self.get_point('navigation', name)
+        try:
+            return self._flat[('navigation', name)]
+        except KeyError:
+            raise self._missing('navigation', name) from None
 
     def get_screen(self, name):
         """Shorthand for get_point('screen', name)."""
-        return self.get_point('screen', name)
+        try:
+            return self._flat[('screen', name)]
+        except KeyError:
+            raise self._missing('screen', name) from None
 
     # =========================================================================
     # Region Access Methods (for x, y, width, height)
@@ -105,24 +201,23 @@ class CoordinateManager:
 
     def get_region(self, name):
         """
-        Get an OCR region as a dict with x, y, width, height keys.
+        Get an OCR region with x, y, width, height fields.
 
         Args:
             name: Region name from ocr_regions
 
         Returns:
-            dict: {'x': int, 'y': int, 'width': int, 'height': int}
+            Region: (x, y, width, height), also readable as region['x'] etc.
 
         Raises:
             KeyError: If region not found
         """
-        if 'ocr_regions' not in self.data:
-            raise KeyError("No 'ocr_regions' section in coordinates")
-
-        if name not in self.data['ocr_regions']:
-            raise KeyError(f"OCR region not found: {name}")
-
-        return self.data['ocr_regions'][name].copy()
+        try:
+            return self._flat[('ocr_regions', name)]
+        except KeyError:
+            if 'ocr_regions' not in self.data:
+                raise KeyError("No 'ocr_regions' section in coordinates") from None
+            raise KeyError(f"OCR region not found: {name}") from None
 
     # =========================================================================
     # List/Array Access Methods
@@ -136,22 +231,21 @@ class CoordinateManager:
             rotation: 'first_rotation' or 'after_scroll'
 
         Returns:
-            list: List of {'x': int, 'y': int} dicts
+            tuple: Immutable tuple of Points, shared between callers
         """
-        if 'character_grid' not in self.data:
-            raise KeyError("No 'character_grid' section in coordinates")
-
-        if rotation not in self.data['character_grid']:
-            raise KeyError(f"Character grid rotation not found: {rotation}")
-
-        # Return a copy to prevent modification
-        return [pos.copy() for pos in self.data['character_grid'][rotation]]
+        try:
+            return self._flat[('character_grid', rotation)]
+        except KeyError:
+            if 'character_grid' not in self.data:
+                raise KeyError("No 'character_grid' section in coordinates") from None
+            raise KeyError(f"Character grid rotation not found: {rotation}") from None
 
     def get_character_switcher_grid(self):
-        """Get character switcher grid positions."""
-        if 'character_switcher_grid' not in self.data:
-            raise KeyError("No 'character_switcher_grid' section in coordinates")
-        return [pos.copy() for pos in self.data['character_switcher_grid']]
+        """Get character switcher grid positions as an immutable tuple of Points."""
+        try:
+            return self.data['character_switcher_grid']
+        except KeyError:
+            raise KeyError("No 'character_switcher_grid' section in coordinates") from None
 
     def get_march_preset_position(self, preset_number):
         """
@@ -161,7 +255,7 @@ class CoordinateManager:
             preset_number: Preset number (1-7)
 
         Returns:
-            dict: {'x': int, 'y': int}
+            Point: (x, y)
         """
         if 'march_presets' not in self.data:
             raise KeyError("No 'march_presets' section in coordinates")
@@ -170,16 +264,13 @@ class CoordinateManager:
         if preset_number < 1 or preset_number > len(presets['y_positions']):
             raise ValueError(f"Invalid preset number: {preset_number}")
 
-        return {
-            'x': presets['x'],
-            'y': presets['y_positions'][preset_number - 1]
-        }
+        return Point(presets['x'], presets['y_positions'][preset_number - 1])
 
     def get_go_button_y_positions(self):
-        """Get list of Y positions for 'Go' buttons."""
+        """Get Y positions for 'Go' buttons as an immutable tuple."""
         if 'go_button' in self.data:
-            return self.data['go_button'].get('y_positions', []).copy()
-        return []
+            return self.data['go_button'].get('y_positions', ())
+        return ()
 
     def get_go_button_x(self):
         """Get X position for 'Go' buttons."""
@@ -199,7 +290,7 @@ class CoordinateManager:
             name: Scroll name (e.g., 'character_list', 'character_switcher')
 
         Returns:
-            dict: {'start': {'x', 'y'}, 'end': {'x', 'y'}, 'duration_ms': int}
+            dict: {'start': Point, 'end': Point, 'duration_ms': int}
         """
         if 'scroll' not in self.data:
             raise KeyError("No 'scroll' section in coordinates")
@@ -209,8 +300,8 @@ class CoordinateManager:
 
         scroll = self.data['scroll'][name]
         return {
-            'start': scroll['start'].copy(),
-            'end': scroll['end'].copy(),
+            'start': scroll['start'],
+            'end': scroll['end'],
             'duration_ms': scroll.get('duration_ms', 500)
         }
 
@@ -226,18 +317,14 @@ class CoordinateManager:
             name: Offset name
 
         Returns:
-            dict or int: Offset value (could be {'x', 'y'} or a single int)
+            Point or int: Offset value (could be (x, y) or a single int)
         """
-        if 'offsets' not in self.data:
-            raise KeyError("No 'offsets' section in coordinates")
-
-        if name not in self.data['offsets']:
-            raise KeyError(f"Offset not found: {name}")
-
-        value = self.data['offsets'][name]
-        if isinstance(value, dict):
-            return value.copy()
-        return value
+        try:
+            return self._flat[('offsets', name)]
+        except KeyError:
+            if 'offsets' not in self.data:
+                raise KeyError("No 'offsets' section in coordinates") from None
+            raise KeyError(f"Offset not found: {name}") from None
 
     def get_color_detection(self, name):
         """
@@ -247,7 +334,7 @@ class CoordinateManager:
             name: Color detection name (e.g., 'yellow_star', 'green_checkmark')
 
         Returns:
-            dict: {'hsv_lower': [...], 'hsv_upper': [...], 'pixel_threshold': int}
+            Mapping: Read-only {'hsv_lower': uint8 array, 'hsv_upper': uint8 array, 'pixel_threshold': int}
         """
         if 'color_detection' not in self.data:
             raise KeyError("No 'color_detection' section in coordinates")
@@ -255,7 +342,7 @@ class CoordinateManager:
         if name not in self.data['color_detection']:
             raise KeyError(f"Color detection config not found: {name}")
 
-        return self.data['color_detection'][name].copy()
+        return self.data['color_detection'][name]
 
     # =========================================================================
     # Raw Access (for advanced use cases)
@@ -265,18 +352,30 @@ class CoordinateManager:
         """
         Get raw data by traversing keys.
 
+        Each unique key path is resolved once; the loaded data is immutable,
+        so later calls return the cached value.
+
         Args:
             *keys: Keys to traverse (e.g., 'navigation', 'avatar_icon', 'x')
 
         Returns:
             Any: The value at the specified path
         """
+        try:
+            return self._raw_cache[keys]
+        except KeyError:
+            pass
+
         result = self.data
         for key in keys:
-            if isinstance(result, dict) and key in result:
+            if isinstance(result, (dict, MappingProxyType)) and key in result:
                 result = result[key]
-            elif isinstance(result, list) and isinstance(key, int):
+            elif isinstance(result, _KeyAccess) and key in result._fields:
+                result = result[key]
+            elif isinstance(result, tuple) and isinstance(key, int):
                 result = result[key]
             else:
                 raise KeyError(f"Key not found: {key}")
+
+        self._raw_cache[keys] = result
         return result
@@ -9,7 +9,10 @@ Tasks marked as completed today will be skipped unless force mode is enabled.
 import os
 import json
 import logging
-from datetime import datetime, timezone
+import time
+import threading
+from datetime import datetime, timezone, timedelta
+from json_io import json_loads, json_dumps
 
 
 class DailyTaskTracker:
@@ -19,53 +22,161 @@ class DailyTaskTracker:
     TASK_BUILD = "build"
     TASK_EXPEDITION = "expedition"
 
+    # Completions marked within this many seconds are written in one save
+    SAVE_DEBOUNCE_SECONDS = 1.0
+
+    # Bit per task in each character's completion bitmask
+    TASK_BITS = {
+        TASK_BUILD: 1 << 0,
+        TASK_EXPEDITION: 1 << 1,
+    }
+
     def __init__(self, tracking_file_path):
         """
         Initialize the daily task tracker.
 
+        Tracking data is {"date": "YYYY-MM-DD", "mask": {character_index: task_bits}};
+        the masks only ever describe the stored UTC date and are cleared when it rolls over.
+
         Args:
             tracking_file_path: Full path to the tracking JSON file
                                (e.g., instances/default_daily_tasks.json)
         """
         self.logger = logging.getLogger(__name__)
         self.tracking_file = tracking_file_path
+
+        # Today's UTC date string and the epoch time at which it expires (next UTC midnight)
+        self._today_cache = (None, 0.0)
+
         self.data = self._load_tracking_data()
 
+        # Shares the dict object with self.data["mask"]; always mutated in place, never replaced
+        self._masks = self.data["mask"]
+
+        # Debounced saves for mark_task_completed; the directory is created on first save
+        self._dir = os.path.dirname(tracking_file_path)
+        self._dir_ensured = False
+        self._dirty = False
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+
     def _load_tracking_data(self):
         """Load tracking data from JSON file."""
-        if os.path.exists(self.tracking_file):
-            try:
-                with open(self.tracking_file, 'r') as f:
-                    data = json.load(f)
-                self.logger.debug(f"Loaded daily task tracking from {self.tracking_file}")
-                return data
-            except (json.JSONDecodeError, IOError) as e:
-                self.logger.warning(f"Error loading tracking file, starting fresh: {e}")
+        try:
+            with open(self.tracking_file, 'rb') as f:
+                data = json_loads(f.read())
+
+            if "mask" in data:
+                # JSON keys are strings; keep character indexes as ints in memory
+                data["mask"] = {int(char_key): int(bits) for char_key, bits in data["mask"].items()}
+            else:
+                data = self._migrate_legacy_data(data)
+
+            self.logger.debug(f"Loaded daily task tracking from {self.tracking_file}")
+            return data
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError, ValueError, TypeError, AttributeError) as e:
+            self.logger.warning(f"Error loading tracking file, starting fresh: {e}")
 
         # Return empty structure if file doesn't exist or is corrupted
         return {
             "last_updated": None,
-            "characters": {}
+            "date": None,
+            "mask": {}
         }
 
-    def _save_tracking_data(self):
-        """Save tracking data to JSON file."""
-        try:
-            self.data["last_updated"] = datetime.now(timezone.utc).isoformat()
-
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.tracking_file), exist_ok=True)
+    def _migrate_legacy_data(self, data):
+        """Convert the old {"characters": {index: {task: date}}} format, keeping today's completions."""
+        today = self._get_today_utc()
+        mask = {}
+        for char_key, tasks in data.get("characters", {}).items():
+            bits = 0
+            for task_name, completion_date in tasks.items():
+                if completion_date == today:
+                    bits |= self.TASK_BITS.get(task_name, 0)
+            if bits:
+                mask[int(char_key)] = bits
 
-            with open(self.tracking_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
+        return {
+            "last_updated": data.get("last_updated"),
+            "date": today,
+            "mask": mask
+        }
 
-            self.logger.debug(f"Saved daily task tracking to {self.tracking_file}")
-        except IOError as e:
-            self.logger.error(f"Error saving tracking file: {e}")
+    def _save_tracking_data(self):
+        """Save tracking data to JSON file atomically (write temp file, then replace)."""
+        with self._save_lock:
+            self._cancel_save_timer()
+            self._dirty = False
+            try:
+                self.data["last_updated"] = datetime.now(timezone.utc).isoformat()
+
+                # Ensure directory exists
+                if not self._dir_ensured:
+                    os.makedirs(self._dir, exist_ok=True)
+                    self._dir_ensured = True
+
+                tmp_path = self.tracking_file + ".tmp"
+                serialized = dict(self.data)
+                serialized["mask"] = {
+                    str(char_index): bits for char_index, bits in self._masks.items()
+                }
+                with open(tmp_path, 'wb') as f:
+                    f.write(json_dumps(serialized))
+                os.replace(tmp_path, self.tracking_file)
+
+                self.logger.debug(f"Saved daily task tracking to {self.tracking_file}")
+            except IOError as e:
+                self.logger.error(f"Error saving tracking file: {e}")
+
+    def _cancel_save_timer(self):
+        """Cancel a pending debounced save, if any."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+
+    def _schedule_save(self):
+        """Mark data dirty and save once no further changes arrive within the debounce window."""
+        with self._save_lock:
+            self._dirty = True
+            self._cancel_save_timer()
+            self._save_timer = threading.Timer(self.SAVE_DEBOUNCE_SECONDS, self.flush)
+            # Timers inherit daemon from their creator (usually a daemon automation
+            # thread); a non-daemon timer lets a pending save finish at exit
+            self._save_timer.daemon = False
+            self._save_timer.start()
+
+    def flush(self):
+        """Write pending changes to disk immediately."""
+        if self._dirty:
+            self._save_tracking_data()
 
     def _get_today_utc(self):
-        """Get today's date in UTC as a string (YYYY-MM-DD)."""
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        """Get today's date in UTC as a string (YYYY-MM-DD), cached until UTC midnight."""
+        today, expires = self._today_cache
+        if time.time() < expires:
+            return today
+
+        now = datetime.now(timezone.utc)
+        next_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        today = now.strftime("%Y-%m-%d")
+        self._today_cache = (today, next_midnight.timestamp())
+        return today
+
+    def _get_task_bit(self, task_name):
+        """Get the bitmask bit for a task."""
+        try:
+            return self.TASK_BITS[task_name]
+        except KeyError:
+            raise ValueError(f"Unknown daily task: {task_name}") from None
+
+    def _rollover(self):
+        """Clear the completion masks if the UTC day changed since they were recorded."""
+        today = self._get_today_utc()
+        if self.data["date"] != today:
+            self.data["date"] = today
+            self._masks.clear()
 
     def is_task_completed_today(self, character_index, task_name):
         """
@@ -78,16 +189,10 @@ class DailyTaskTracker:
         Returns:
             bool: True if task was completed today, False otherwise
         """
-        char_key = str(character_index)
-        today = self._get_today_utc()
-
-        if char_key not in self.data["characters"]:
-            return False
+        with self._save_lock:
+            self._rollover()
 
-        char_data = self.data["characters"][char_key]
-        completion_date = char_data.get(task_name)
-
-        if completion_date == today:
+        if self._masks.get(character_index, 0) & self._get_task_bit(task_name):
             self.logger.debug(
                 f"Task '{task_name}' already completed today (UTC) for character {character_index}"
             )
@@ -103,17 +208,15 @@ class DailyTaskTracker:
             character_index: Zero-based index of the character
             task_name: Name of the task (use TASK_BUILD, TASK_EXPEDITION constants)
         """
-        char_key = str(character_index)
-        today = self._get_today_utc()
+        bit = self._get_task_bit(task_name)
 
-        if char_key not in self.data["characters"]:
-            self.data["characters"][char_key] = {}
-
-        self.data["characters"][char_key][task_name] = today
-        self._save_tracking_data()
+        with self._save_lock:
+            self._rollover()
+            self._masks[character_index] = self._masks.get(character_index, 0) | bit
+        self._schedule_save()
 
         self.logger.info(
-            f"Marked '{task_name}' as completed for character {character_index} on {today} (UTC)"
+            f"Marked '{task_name}' as completed for character {character_index} on {self.data['date']} (UTC)"
         )
 
     def reset_all_tasks(self):
@@ -122,7 +225,7 @@ class DailyTaskTracker:
 
         This clears all completion records, allowing all tasks to run again.
         """
-        self.data["characters"] = {}
+        self._masks.clear()
         self._save_tracking_data()
         self.logger.info("Reset all daily task completion tracking")
 
@@ -133,24 +236,31 @@ class DailyTaskTracker:
         Args:
             character_index: Zero-based index of the character
         """
-        char_key = str(character_index)
-        if char_key in self.data["characters"]:
-            del self.data["characters"][char_key]
+        if character_index in self._masks:
+            del self._masks[character_index]
             self._save_tracking_data()
             self.logger.info(f"Reset daily tasks for character {character_index}")
 
+    def _tasks_for_bits(self, bits):
+        """Expand a completion bitmask into {task_name: date} for display."""
+        return {task_name: self.data["date"] for task_name, bit in self.TASK_BITS.items() if bits & bit}
+
     def get_completion_status(self):
         """
         Get the current completion status for all characters.
 
         Returns:
-            dict: Copy of the tracking data for UI display
+            dict: Today's completions for UI display (characters keyed by int index)
         """
-        return {
-            "today_utc": self._get_today_utc(),
-            "last_updated": self.data.get("last_updated"),
-            "characters": self.data.get("characters", {}).copy()
-        }
+        with self._save_lock:
+            self._rollover()
+            return {
+                "today_utc": self.data["date"],
+                "last_updated": self.data.get("last_updated"),
+                "characters": {
+                    char_index: self._tasks_for_bits(bits) for char_index, bits in self._masks.items()
+                }
+            }
 
     def get_character_status(self, character_index):
         """
@@ -160,10 +270,11 @@ class DailyTaskTracker:
             character_index: Zero-based index of the character
 
         Returns:
-            dict: Task completion dates for the character, or empty dict if none
+            dict: Task completion dates for the character (today only), or empty dict if none
         """
-        char_key = str(character_index)
-        return self.data["characters"].get(char_key, {}).copy()
+        with self._save_lock:
+            self._rollover()
+        return self._tasks_for_bits(self._masks.get(character_index, 0))
 
 
 def get_tracker_path_for_instance(instances_dir, instance_id):
@@ -177,4 +288,4 @@ def get_tracker_path_for_instance(instances_dir, instance_id):
     Returns:
         str: Full path to the tracking file
     """
-    return os.path.join(instances_dir, f"{instance_id}_daily_tasks.json")
+    return f"{instances_dir}{os.sep}{instance_id}_daily_tasks.json"
@@ -8,6 +8,10 @@ specifically finding and donating to officer-recommended technologies.
 import time
 import logging
 
+# Donate button taps per recommended technology, sent in bursts so a stop request is noticed between them
+DONATE_CLICKS = 20
+DONATE_BURST_SIZE = 5
+
 
 class DonationAutomation:
     """Automates alliance technology donation workflow."""
@@ -32,6 +36,18 @@ class DonationAutomation:
         self.click_delay_ms = click_delay_ms
         self.stop_check = stop_check_callback
 
+        # Load coordinates from coordinates.json
+        # Navigation buttons
+        self.expand_button = coords.get_nav('expand_button')
+        self.alliance_button = coords.get_nav('alliance_button')
+        self.technology_button = coords.get_nav('technology_button')
+        self.donate_button = coords.get_nav('donate_button')
+
+        # OCR regions and offsets
+        self.alliance_menu_region = coords.get_region('alliance_menu')
+        self.officer_recommendation_region = coords.get_region('officer_recommendation')
+        self.officer_recommendation_offset = coords.get_offset('officer_recommendation_click')
+
     def check_stop_requested(self):
         """Check if automation should stop."""
         if self.stop_check and self.stop_check():
@@ -39,14 +55,19 @@ class DonationAutomation:
             return True
         return False
 
-    def close_dialogs(self):
-        """Close any open dialogs using escape key."""
+    def close_dialogs(self, count=1):
+        """
+        Close any open dialogs using escape key.
+
+        Args:
+            count: Number of escape presses, sent together in one ADB command
+        """
         if self.check_stop_requested():
             return False
 
         self.logger.info("Closing dialogs")
-        if self.bluestacks.send_escape():
-            self.logger.info("Sent escape key to close dialog")
+        if self.bluestacks.send_escape_n(count):
+            self.logger.info(f"Sent {count} escape key(s) to close dialogs")
             time.sleep(1)
             return True
 
@@ -56,8 +77,7 @@ class DonationAutomation:
     def expand_bottom_bar(self):
         """Expand bottom bar if it's not expanded yet."""
         if not self.screen.is_bottom_bar_expanded():
-            expand_button = self.coords.get_nav('expand_button')
-            if not self.bluestacks.click(expand_button['x'], expand_button['y'], self.click_delay_ms):
+            if not self.bluestacks.click(self.expand_button['x'], self.expand_button['y'], self.click_delay_ms):
                 self.logger.error('Failed to expand bottom bar')
                 return False
 
@@ -81,10 +101,11 @@ class DonationAutomation:
         self.logger.info("Looking for Technology button...")
 
         # Method 1: Try OCR to find "Technology" text
-        alliance_menu_region = self.coords.get_region('alliance_menu')
+        # The alliance screen was just captured by is_char_in_alliance; reuse that frame
         result = self.ocr.detect_text_position(
             ["Technology", "technology", "TECHNOLOGY"],
-            alliance_menu_region
+            self.alliance_menu_region,
+            screenshot=self.ocr.capture_or_reuse()
         )
 
         if result:
@@ -98,8 +119,7 @@ class DonationAutomation:
 
         # Method 2: Fall back to hardcoded position
         self.logger.info("Technology not found via OCR, using fallback position")
-        technology_button = self.coords.get_nav('technology_button')
-        if not self.bluestacks.click(technology_button['x'], technology_button['y'], self.click_delay_ms):
+        if not self.bluestacks.click(self.technology_button['x'], self.technology_button['y'], self.click_delay_ms):
             self.logger.error("Failed to click Technology button (fallback position)")
             return False
 
@@ -109,8 +129,8 @@ class DonationAutomation:
         """
         Find Officer's Recommendation and donate to it.
 
-        Uses color detection (red banner) as primary method,
-        falls back to OCR if color detection fails.
+        Tries color detection (red banner) first, and OCR on the same
+        screenshot only if color detection misses.
 
         Returns:
             bool: True if successful, False otherwise
@@ -118,27 +138,32 @@ class DonationAutomation:
         if self.check_stop_requested():
             return False
 
-        region = self.coords.get_region('officer_recommendation')
-        result = None
+        region = self.officer_recommendation_region
 
-        # Method 1: Try color detection for red banner (most reliable)
-        self.logger.info("Trying color detection for Officer's Recommendation banner...")
-        result = self.ocr.detect_red_banner_position(region)
+        screenshot = self.ocr.capture_screenshot()
+        if screenshot is None:
+            self.logger.error("Failed to take screenshot for Officer's Recommendation search")
+            return False
 
+        # Method 1: color detection (cheap), preferred when it finds the banner
+        self.logger.info("Searching for Officer's Recommendation (color detection)...")
+        result = self.ocr.detect_red_banner_position(region, screenshot)
         if result:
             self.logger.info(f"Found Officer's Recommendation via color detection at ({result['x']}, {result['y']})")
-        else:
-            # Method 2: Fall back to OCR
-            self.logger.info("Color detection failed, trying OCR fallback...")
+
+        # Method 2: OCR on the same screenshot, only if color detection missed
+        if not result and not self.check_stop_requested():
+            self.logger.info("Color detection missed, trying OCR...")
             result = self.ocr.detect_text_position(
                 ["Officer's Recommendation", "Officer", "Recommendation", "mendation"],
-                region
+                region,
+                screenshot=screenshot
             )
             if result:
                 self.logger.info(f"Found Officer's Recommendation via OCR at ({result['x']}, {result['y']})")
 
         if result:
-            offset = self.coords.get_offset('officer_recommendation_click')
+            offset = self.officer_recommendation_offset
             click_x = result['x'] + offset['x']
             click_y = result['y'] + offset['y']
 
@@ -146,19 +171,19 @@ class DonationAutomation:
                 self.logger.error("Failed to click on Recommended Tech")
                 return False
 
-            donate_button = self.coords.get_nav('donate_button')
-            # Click Donate 20 times
-            for i in range(20):
-                self.bluestacks.click(donate_button['x'], donate_button['y'], 500)
+            donate_button = self.donate_button
+            # Click Donate 20 times, one ADB command per burst
+            for _ in range(DONATE_CLICKS // DONATE_BURST_SIZE):
+                if self.check_stop_requested():
+                    return False
+                self.bluestacks.click_burst(donate_button['x'], donate_button['y'], DONATE_BURST_SIZE, 500)
 
             # Exit to home screen after donation completes
-            for i in range(3):
-                self.close_dialogs()
+            self.close_dialogs(3)
             return True
         else:
             self.logger.error("Recommended Tech not found (both color and OCR detection failed)")
-            for i in range(2):
-                self.close_dialogs()
+            self.close_dialogs(2)
             return False
 
     def perform_recommended_tech_donation(self):
@@ -176,8 +201,7 @@ class DonationAutomation:
         if self.check_stop_requested():
             return False
 
-        alliance_button = self.coords.get_nav('alliance_button')
-        if not self.bluestacks.click(alliance_button['x'], alliance_button['y'], self.click_delay_ms):
+        if not self.bluestacks.click(self.alliance_button['x'], self.alliance_button['y'], self.click_delay_ms):
             self.logger.error("Failed to open alliance screen")
             return False
 
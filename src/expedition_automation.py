@@ -17,6 +17,7 @@ HOW TO CREATE NEW AUTOMATION FEATURES - DOCUMENTATION
 2. CLASS STRUCTURE:
    - __init__: Receive dependencies (ocr, screen, bluestacks, coords)
    - check_stop_requested(): Allow graceful cancellation
+   - @cancellable on step methods: skip the step once a stop is requested
    - Main workflow method (e.g., collect_expedition_rewards)
    - Helper methods for each step
 
@@ -40,6 +41,26 @@ HOW TO CREATE NEW AUTOMATION FEATURES - DOCUMENTATION
 """
 import time
 import logging
+from functools import wraps
+
+# Upper bounds for screen transitions; polling returns as soon as the screen appears
+CAMPAIGN_LOAD_TIMEOUT = 3.0
+REWARDS_DIALOG_TIMEOUT = 2.0
+EXPEDITION_LOAD_TIMEOUT = 2.0
+HOME_SETTLE_TIMEOUT = 3.0
+
+# Pause between back-to-back escapes while leaving the Expedition screens
+ESCAPE_INTERVAL_MS = 1000
+
+
+def cancellable(func):
+    """Decorator: return False without running the step if a stop was requested."""
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self.check_stop_requested():
+            return False
+        return func(self, *args, **kwargs)
+    return wrapper
 
 
 class ExpeditionAutomation:
@@ -74,9 +95,10 @@ class ExpeditionAutomation:
         self.coords = coords
         self.click_delay_ms = click_delay_ms
         self.stop_check = stop_check_callback
+        self._stop_fast = stop_check_callback or (lambda: False)
 
         # Load coordinates from coordinates.json
-        # Navigation buttons
+        # Navigation buttons (Point tuples; read via .x/.y)
         self.expand_button = coords.get_nav('expand_button')
         self.campaign_button = coords.get_nav('campaign_button')
         self.expedition_button = coords.get_nav('expedition_button')
@@ -88,6 +110,9 @@ class ExpeditionAutomation:
         # OCR regions
         self.campaign_screen_region = coords.get_region('campaign_screen')
 
+        # OCR keywords, built once (tuples are hashable for the OCR keyword cache)
+        self._expedition_keywords = ("Expedition", "expedition")
+
     def check_stop_requested(self):
         """
         Check if automation should stop.
@@ -95,11 +120,12 @@ class ExpeditionAutomation:
         This is called frequently to allow graceful cancellation.
         Returns True if stop was requested.
         """
-        if self.stop_check and self.stop_check():
+        if self._stop_fast():
             self.logger.info("Stop requested during expedition automation")
             return True
         return False
 
+    @cancellable
     def close_dialog(self):
         """
         Close current dialog/screen using escape key.
@@ -107,15 +133,13 @@ class ExpeditionAutomation:
         Returns:
             bool: True if escape was sent successfully
         """
-        if self.check_stop_requested():
-            return False
-
         self.logger.info("Pressing Escape to close dialog")
         if self.bluestacks.send_escape():
             time.sleep(1)
             return True
         return False
 
+    @cancellable
     def handle_exit_dialog(self):
         """
         Check for and handle the "Exit the game?" dialog.
@@ -125,13 +149,10 @@ class ExpeditionAutomation:
         Returns:
             bool: True if dialog was handled (or not present), False on failure
         """
-        if self.check_stop_requested():
-            return False
-
         if self.screen.is_exit_game_dialog():
             self.logger.info("Exit dialog detected, clicking Cancel to dismiss")
-            if not self.bluestacks.click(self.exit_dialog_cancel['x'],
-                                         self.exit_dialog_cancel['y'],
+            if not self.bluestacks.click(self.exit_dialog_cancel.x,
+                                         self.exit_dialog_cancel.y,
                                          self.click_delay_ms):
                 self.logger.error("Failed to click Cancel on exit dialog")
                 return False
@@ -140,6 +161,26 @@ class ExpeditionAutomation:
 
         return True  # No dialog present is also success
 
+    @cancellable
+    def escape_and_settle(self, count):
+        """
+        Press Escape several times in one ADB command, then dismiss the exit dialog if it opened.
+
+        Args:
+            count: Number of escapes to send
+
+        Returns:
+            bool: True if completed, False on failure
+        """
+        self.logger.info(f"Pressing Escape {count} times")
+        if not self.bluestacks.send_escape_n(count, ESCAPE_INTERVAL_MS):
+            self.logger.error("Failed to send escapes")
+            return False
+
+        # One extra escape on the home screen opens the exit dialog
+        return self.handle_exit_dialog()
+
+    @cancellable
     def expand_bottom_bar(self):
         """
         Expand the bottom navigation bar if it's not already expanded.
@@ -149,14 +190,11 @@ class ExpeditionAutomation:
         Returns:
             bool: True if bottom bar is expanded, False on failure
         """
-        if self.check_stop_requested():
-            return False
-
         # Check if already expanded using screen detector
         if not self.screen.is_bottom_bar_expanded():
             self.logger.info("Expanding bottom bar...")
-            if not self.bluestacks.click(self.expand_button['x'],
-                                         self.expand_button['y'],
+            if not self.bluestacks.click(self.expand_button.x,
+                                         self.expand_button.y,
                                          self.click_delay_ms):
                 self.logger.error("Failed to click expand button")
                 return False
@@ -165,6 +203,7 @@ class ExpeditionAutomation:
         self.logger.info("Bottom bar is expanded")
         return True
 
+    @cancellable
     def click_campaign(self):
         """
         Click on the Campaign button to open Campaign screen.
@@ -174,24 +213,25 @@ class ExpeditionAutomation:
         Returns:
             bool: True if clicked successfully, False otherwise
         """
-        if self.check_stop_requested():
-            return False
-
         self.logger.info("Opening Campaign screen...")
 
         # Use hardcoded position - OCR returns text position which doesn't align with button
-        click_x = self.campaign_button['x']
-        click_y = self.campaign_button['y']
+        click_x = self.campaign_button.x
+        click_y = self.campaign_button.y
         self.logger.info(f"Clicking Campaign button at ({click_x}, {click_y})")
 
         if not self.bluestacks.click(click_x, click_y, self.click_delay_ms):
             self.logger.error("Failed to click Campaign button")
             return False
 
-        time.sleep(2)  # Wait for Campaign screen to load
-        self.logger.info("Campaign screen opened")
+        # Wait for Campaign screen to load, continuing as soon as it shows
+        if self.screen.wait_for(self.screen.is_campaign_screen, CAMPAIGN_LOAD_TIMEOUT):
+            self.logger.info("Campaign screen opened")
+        else:
+            self.logger.info("Campaign screen not confirmed, continuing")
         return True
 
+    @cancellable
     def click_expedition(self):
         """
         Click on Expedition from the Campaign screen.
@@ -203,15 +243,13 @@ class ExpeditionAutomation:
         Returns:
             bool: True if clicked successfully, False otherwise
         """
-        if self.check_stop_requested():
-            return False
-
         self.logger.info("Opening Expedition...")
 
-        # Try OCR first to find "Expedition" text
-        expedition_pos = self.ocr.detect_text_position(
-            ["Expedition", "expedition"],
-            self.campaign_screen_region
+        # Try OCR first to find "Expedition" text (cached while the Campaign screen looks the same)
+        expedition_pos = self.ocr.detect_text_position_cached(
+            self._expedition_keywords,
+            self.campaign_screen_region,
+            scale=self.ocr.LARGE_TEXT_SCALE
         )
 
         if expedition_pos:
@@ -220,17 +258,19 @@ class ExpeditionAutomation:
         else:
             # Fall back to hardcoded position
             self.logger.info("Expedition not found via OCR, using fallback position")
-            click_x = self.expedition_button['x']
-            click_y = self.expedition_button['y']
+            click_x = self.expedition_button.x
+            click_y = self.expedition_button.y
 
         if not self.bluestacks.click(click_x, click_y, self.click_delay_ms):
             self.logger.error("Failed to click Expedition button")
             return False
 
-        time.sleep(2)  # Wait for Expedition screen to load
+        # Wait for Expedition screen to load, continuing once it stops changing
+        self.screen.wait_until_stable(EXPEDITION_LOAD_TIMEOUT)
         self.logger.info("Expedition screen opened")
         return True
 
+    @cancellable
     def collect_expedition_chests(self):
         """
         Collect expedition reward chests.
@@ -243,32 +283,28 @@ class ExpeditionAutomation:
         Returns:
             bool: True if collection completed, False on failure
         """
-        if self.check_stop_requested():
-            return False
-
         self.logger.info("Collecting expedition chests...")
 
         # Click first chest position
-        self.logger.info(f"Clicking chest 1 at ({self.expedition_chest_1['x']}, {self.expedition_chest_1['y']})")
-        if not self.bluestacks.click(self.expedition_chest_1['x'],
-                                     self.expedition_chest_1['y'],
+        self.logger.info(f"Clicking chest 1 at ({self.expedition_chest_1.x}, {self.expedition_chest_1.y})")
+        if not self.bluestacks.click(self.expedition_chest_1.x,
+                                     self.expedition_chest_1.y,
                                      self.click_delay_ms):
             self.logger.error("Failed to click chest 1")
             return False
         time.sleep(1)
 
-        # Click second chest position 3 times
-        for i in range(3):
-            if self.check_stop_requested():
-                return False
+        # Click second chest position 3 times, sent as one ADB command
+        if self.check_stop_requested():
+            return False
 
-            self.logger.info(f"Clicking chest 2 at ({self.expedition_chest_2['x']}, {self.expedition_chest_2['y']}) - click {i+1}/3")
-            if not self.bluestacks.click(self.expedition_chest_2['x'],
-                                         self.expedition_chest_2['y'],
-                                         self.click_delay_ms):
-                self.logger.error(f"Failed to click chest 2 (attempt {i+1})")
-                return False
-            time.sleep(0.5)
+        self.logger.info(f"Clicking chest 2 at ({self.expedition_chest_2.x}, {self.expedition_chest_2.y}) 3 times")
+        if not self.bluestacks.click_burst(self.expedition_chest_2.x,
+                                           self.expedition_chest_2.y,
+                                           3,
+                                           self.click_delay_ms + 500):
+            self.logger.error("Failed to click chest 2")
+            return False
 
         # Press Escape to go back to Expedition screen
         self.logger.info("Going back to Expedition screen")
@@ -276,36 +312,32 @@ class ExpeditionAutomation:
 
         return True
 
+    @cancellable
     def collect_expedition_rewards(self):
         """
         Final step: click collect button and navigate back.
 
         Workflow:
         1. Click collect position (124, 223)
-        2. Check if Rewards dialog appeared (if rewards were already collected, it won't)
+        2. Wait for the Rewards dialog (if rewards were already collected, it won't appear)
         3. If rewards dialog: Escape 3 times (rewards -> expedition -> campaign -> home)
         4. If no rewards dialog: Escape 2 times (expedition -> campaign -> home)
-        5. After each escape, check for and handle exit dialog
+        5. After the escapes, check for and handle exit dialog
 
         Returns:
             bool: True if completed, False on failure
         """
-        if self.check_stop_requested():
-            return False
-
         self.logger.info("Collecting expedition rewards...")
 
         # Click collect position
-        self.logger.info(f"Clicking collect at ({self.expedition_collect['x']}, {self.expedition_collect['y']})")
-        if not self.bluestacks.click(self.expedition_collect['x'],
-                                     self.expedition_collect['y'],
+        self.logger.info(f"Clicking collect at ({self.expedition_collect.x}, {self.expedition_collect.y})")
+        if not self.bluestacks.click(self.expedition_collect.x,
+                                     self.expedition_collect.y,
                                      self.click_delay_ms):
             self.logger.error("Failed to click collect")
             return False
-        time.sleep(1.5)
-
-        # Check if rewards dialog appeared
-        rewards_dialog_appeared = self.screen.is_rewards_dialog()
+        # Check if rewards dialog appeared, continuing as soon as it shows
+        rewards_dialog_appeared = self.screen.wait_for(self.screen.is_rewards_dialog, REWARDS_DIALOG_TIMEOUT)
 
         if rewards_dialog_appeared:
             self.logger.info("Rewards dialog detected - need 3 escapes")
@@ -315,21 +347,13 @@ class ExpeditionAutomation:
             num_escapes = 2
 
         # Navigate back with dynamic number of escapes
-        for i in range(num_escapes):
-            if self.check_stop_requested():
-                return False
-
-            self.logger.info(f"Escape {i + 1}/{num_escapes}")
-            self.close_dialog()
-
-            # Check for and handle exit dialog after each escape
-            if not self.handle_exit_dialog():
-                self.logger.error("Failed to handle exit dialog")
-                return False
+        if not self.escape_and_settle(num_escapes):
+            self.logger.error("Failed to navigate back from expedition")
+            return False
 
         # Wait for screen to fully return to home before next action
         self.logger.info("Waiting for screen to settle after expedition...")
-        time.sleep(3)
+        self.screen.wait_until_stable(HOME_SETTLE_TIMEOUT)
 
         return True
 
@@ -351,42 +375,19 @@ class ExpeditionAutomation:
         """
         self.logger.info("=== Starting Expedition Reward Collection ===")
 
-        # Step 1: Expand bottom bar
-        if not self.expand_bottom_bar():
-            self.logger.error("Failed to expand bottom bar")
-            return False
-
-        if self.check_stop_requested():
-            return False
-
-        # Step 2: Click Campaign
-        if not self.click_campaign():
-            self.logger.error("Failed to open Campaign screen")
-            return False
-
-        if self.check_stop_requested():
-            return False
-
-        # Step 3: Click Expedition
-        if not self.click_expedition():
-            self.logger.error("Failed to open Expedition")
-            return False
-
-        if self.check_stop_requested():
-            return False
-
-        # Step 4: Collect chests
-        if not self.collect_expedition_chests():
-            self.logger.error("Failed to collect expedition chests")
-            return False
-
-        if self.check_stop_requested():
-            return False
+        # Each step is cancellable, so a stop request ends the loop at the next step
+        steps = (
+            (self.expand_bottom_bar, "expand bottom bar"),
+            (self.click_campaign, "open Campaign screen"),
+            (self.click_expedition, "open Expedition"),
+            (self.collect_expedition_chests, "collect expedition chests"),
+            (self.collect_expedition_rewards, "collect rewards"),
+        )
 
-        # Step 5: Collect rewards and navigate back
-        if not self.collect_expedition_rewards():
-            self.logger.error("Failed to collect rewards")
-            return False
+        for step, description in steps:
+            if not step():
+                self.logger.error(f"Failed to {description}")
+                return False
 
         self.logger.info("=== Expedition Reward Collection Complete ===")
         return True
@@ -1,29 +1,35 @@
 #!/usr/bin/env python3
+import io
 import os
-import sys
-import json
 import logging
-import uuid
+import secrets
+import errno
 import shutil
+import threading
 from config_manager import ConfigManager
+from app_paths import get_appdata_dir
+from json_io import json_loads, json_dumps
 
-# Application name for AppData folder
-APP_NAME = "RoK Automation"
+# Process-wide InstanceManager returned by get_instance_manager()
+_shared_instance_manager = None
+_shared_instance_manager_lock = threading.Lock()
 
 
-def get_appdata_dir():
-    """Get the appropriate application data directory for the current OS."""
-    if sys.platform == "win32":
-        # Windows: Use %APPDATA%/RoK Automation
-        base = os.environ.get("APPDATA", os.path.expanduser("~"))
-    elif sys.platform == "darwin":
-        # macOS: Use ~/Library/Application Support/RoK Automation
-        base = os.path.join(os.path.expanduser("~"), "Library", "Application Support")
-    else:
-        # Linux/other: Use ~/.config/RoK Automation
-        base = os.environ.get("XDG_CONFIG_HOME", os.path.join(os.path.expanduser("~"), ".config"))
+def get_instance_manager():
+    """
+    Get the process-wide InstanceManager, creating it on first use.
 
-    return os.path.join(base, APP_NAME)
+    Sharing one manager means the index is read from disk once and every
+    window sees the same instance list.
+
+    Returns:
+        InstanceManager: The shared instance manager
+    """
+    global _shared_instance_manager
+    with _shared_instance_manager_lock:
+        if _shared_instance_manager is None:
+            _shared_instance_manager = InstanceManager()
+        return _shared_instance_manager
 
 
 class InstanceManager:
@@ -41,6 +47,13 @@ class InstanceManager:
         self.instances = {}
         self.current_instance_id = None
 
+        # Parsed ConfigManager per instance: instance_id -> (manager, file size and mtime_ns).
+        # get_config_manager hands out copies, so callers never share this object.
+        self._config_cache = {}
+
+        # Full config file path per instance, joined once
+        self._config_paths = {}
+
         # Determine instances directory
         if instances_dir:
             # Custom directory specified
@@ -87,16 +100,16 @@ class InstanceManager:
                 # Create parent directory
                 os.makedirs(os.path.dirname(self.instances_dir), exist_ok=True)
 
-                # Copy entire instances folder to AppData
-                shutil.copytree(local_instances, self.instances_dir)
-
-                # Rename old folder to indicate migration completed
-                backup_name = f"{local_instances}_migrated_backup"
-                if os.path.exists(backup_name):
-                    shutil.rmtree(backup_name)
-                os.rename(local_instances, backup_name)
+                # Move the folder in one rename; copy only across devices
+                try:
+                    os.rename(local_instances, self.instances_dir)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.copytree(local_instances, self.instances_dir)
+                    shutil.rmtree(local_instances)
 
-                self.logger.info(f"Migration complete. Old folder renamed to: {backup_name}")
+                self.logger.info(f"Migration complete. Instances moved to: {self.instances_dir}")
             except Exception as e:
                 self.logger.error(f"Migration failed: {e}. Using local instances folder.")
                 self.instances_dir = local_instances
@@ -128,17 +141,37 @@ class InstanceManager:
             # The constructor will create a default config file
 
         # Save index
-        with open(self.index_file, 'w') as f:
-            json.dump(index_data, f, indent=4)
+        self._write_index(index_data)
+
+    def _write_index(self, index_data):
+        """Write index data atomically (temp file, then replace)."""
+        tmp_path = self.index_file + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(json_dumps(index_data))
+        os.replace(tmp_path, self.index_file)
+
+    @staticmethod
+    def _write_config(config, config_path):
+        """Write a ConfigParser to disk in one write, atomically (temp file, then replace)."""
+        buf = io.StringIO()
+        config.write(buf)
+        tmp_path = config_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(buf.getvalue().encode('utf-8'))
+        os.replace(tmp_path, config_path)
 
     def _load_instances(self):
         """Load instance information from index file"""
         try:
-            with open(self.index_file, 'r') as f:
-                index_data = json.load(f)
+            with open(self.index_file, 'rb') as f:
+                index_data = json_loads(f.read())
 
             # Convert to dictionary for easier access
             self.instances = {instance["id"]: instance for instance in index_data.get("instances", [])}
+            self._config_paths = {
+                instance_id: os.path.join(self.instances_dir, instance["config_file"])
+                for instance_id, instance in self.instances.items()
+            }
             self.current_instance_id = index_data.get("current", None)
 
             if not self.instances:
@@ -161,8 +194,7 @@ class InstanceManager:
                 "current": self.current_instance_id
             }
 
-            with open(self.index_file, 'w') as f:
-                json.dump(index_data, f, indent=4)
+            self._write_index(index_data)
 
             self.logger.info("Instance index saved")
 
@@ -196,10 +228,17 @@ class InstanceManager:
             return True
         return False
 
+    def _generate_instance_id(self):
+        """Generate a random 8-character hex ID not used by any existing instance"""
+        while True:
+            instance_id = secrets.token_hex(4)
+            if instance_id not in self.instances:
+                return instance_id
+
     def create_instance(self, name, bluestacks_instance, adb_port, description=""):
         """Create a new instance configuration"""
         # Generate a unique ID
-        instance_id = str(uuid.uuid4())[:8]
+        instance_id = self._generate_instance_id()
 
         # Create config file name
         config_file = f"{instance_id}.ini"
@@ -215,26 +254,24 @@ class InstanceManager:
             "adb_port": adb_port
         }
 
-        # Create config file by copying from template or default
-        template_path = os.path.join(self.instances_dir, "default.ini")
-        if not os.path.exists(template_path):
-            # If no template, use the main config.ini if it exists
-            template_path = "config.ini"
-
-        if os.path.exists(template_path):
-            shutil.copy(template_path, config_path)
+        # Create config file by copying from template, or the main config.ini if there is none
+        for template_path in (os.path.join(self.instances_dir, "default.ini"), "config.ini"):
+            try:
+                shutil.copy(template_path, config_path)
+                break
+            except FileNotFoundError:
+                continue
 
         # Update the new config with instance-specific settings
         config_manager = ConfigManager(config_path)
-        config = config_manager.config
-        config['BlueStacks']['bluestacks_instance_name'] = bluestacks_instance
-        config['BlueStacks']['adb_port'] = adb_port
+        config_manager.set('BlueStacks', 'bluestacks_instance_name', bluestacks_instance)
+        config_manager.set('BlueStacks', 'adb_port', adb_port)
 
-        with open(config_path, 'w') as f:
-            config.write(f)
+        self._write_config(config_manager.config, config_path)
 
         # Add to instances dictionary
         self.instances[instance_id] = instance
+        self._config_paths[instance_id] = config_path
 
         # Save index
         self._save_index()
@@ -260,18 +297,22 @@ class InstanceManager:
 
         # Update config file if BS instance or port changed
         if bluestacks_instance is not None or adb_port is not None:
-            config_path = os.path.join(self.instances_dir, instance["config_file"])
-            if os.path.exists(config_path):
-                config_manager = ConfigManager(config_path)
-                config = config_manager.config
+            config_path = self._config_paths[instance_id]
+            try:
+                config_manager = self.get_config_manager(instance_id, create_default=False)
+            except FileNotFoundError:
+                config_manager = None  # No config file to update
 
+            if config_manager is not None:
                 if bluestacks_instance is not None:
-                    config['BlueStacks']['bluestacks_instance_name'] = bluestacks_instance
+                    config_manager.set('BlueStacks', 'bluestacks_instance_name', bluestacks_instance)
                 if adb_port is not None:
-                    config['BlueStacks']['adb_port'] = adb_port
+                    config_manager.set('BlueStacks', 'adb_port', adb_port)
 
-                with open(config_path, 'w') as f:
-                    config.write(f)
+                self._write_config(config_manager.config, config_path)
+
+                # Keep the cached manager valid for the file we just wrote
+                self._config_cache[instance_id] = (config_manager.copy(), self._config_stat(config_path))
 
         # Save index
         self._save_index()
@@ -283,18 +324,18 @@ class InstanceManager:
         if instance_id not in self.instances:
             return False
 
-        instance = self.instances[instance_id]
-
         # Delete config file
-        config_path = os.path.join(self.instances_dir, instance["config_file"])
-        if os.path.exists(config_path):
-            try:
-                os.remove(config_path)
-            except Exception as e:
-                self.logger.error(f"Error deleting config file: {e}")
+        try:
+            os.remove(self._config_paths[instance_id])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Error deleting config file: {e}")
 
         # Remove from instances dictionary
         del self.instances[instance_id]
+        self._config_cache.pop(instance_id, None)
+        self._config_paths.pop(instance_id, None)
 
         # If this was the current instance, reset current
         if self.current_instance_id == instance_id:
@@ -323,8 +364,31 @@ class InstanceManager:
             description=f"Copy of {source_instance['name']}"
         )
 
-    def get_config_manager(self, instance_id=None):
-        """Get a ConfigManager for the specified instance or current instance"""
+    @staticmethod
+    def _config_stat(config_path):
+        """Size and nanosecond mtime of a config file, or None if it cannot be read."""
+        try:
+            st = os.stat(config_path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def get_config_manager(self, instance_id=None, create_default=True):
+        """
+        Get a ConfigManager for the specified instance or current instance.
+
+        The file is parsed once and cached until its size or mtime changes. Each
+        call returns a separate copy, so unsaved changes made by one caller (e.g.
+        the GUI) never reach another (e.g. a running automation thread).
+
+        Args:
+            instance_id: Instance to load, or None for the current instance
+            create_default: Passed to ConfigManager; when False a missing config
+                file raises FileNotFoundError instead of being created
+
+        Returns:
+            ConfigManager or None: Copy of the instance's config, or None if there is no such instance
+        """
         if instance_id is None:
             instance = self.get_current_instance()
         else:
@@ -333,5 +397,14 @@ class InstanceManager:
         if not instance:
             return None
 
-        config_path = os.path.join(self.instances_dir, instance["config_file"])
-        return ConfigManager(config_path)
\ No newline at end of file
+        config_path = self._config_paths[instance["id"]]
+        stat = self._config_stat(config_path)
+
+        # Reuse the parsed config unless the file changed on disk
+        cached = self._config_cache.get(instance["id"])
+        if cached and stat is not None and cached[1] == stat:
+            return cached[0].copy()
+
+        config_manager = ConfigManager(config_path, create_default=create_default)
+        self._config_cache[instance["id"]] = (config_manager, self._config_stat(config_path))
+        return config_manager.copy()
\ No newline at end of file
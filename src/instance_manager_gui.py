@@ -3,8 +3,20 @@ import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+from operator import itemgetter
 from instance_manager import InstanceManager
 
+# Treeview columns: (column id, heading, width)
+_TREE_COLUMNS = (
+    ("name", "Name", 150),
+    ("bluestacks", "BlueStacks Instance", 150),
+    ("port", "ADB Port", 80),
+    ("description", "Description", 200),
+)
+
+# Treeview column values for an instance, in column order
+_row_values = itemgetter("name", "bluestacks_instance", "adb_port", "description")
+
 
 def position_dialog_at_cursor(dialog, width, height):
     """Position a dialog window near the mouse cursor.
@@ -43,6 +55,45 @@ def position_dialog_at_cursor(dialog, width, height):
     dialog.geometry(f"{width}x{height}+{pos_x}+{pos_y}")
 
 
+def reopen_dialog(dialog, title, width, height):
+    """Show a withdrawn, reusable dialog again as a modal window near the cursor.
+
+    Args:
+        dialog: The withdrawn Toplevel dialog window
+        title: Window title to show
+        width: Dialog width in pixels
+        height: Dialog height in pixels
+    """
+    dialog.title(title)
+    position_dialog_at_cursor(dialog, width, height)
+    dialog.deiconify()
+    dialog.grab_set()
+
+
+def set_entry_text(entry, text):
+    """Replace the contents of an Entry widget.
+
+    Args:
+        entry: The ttk.Entry to update
+        text: New text
+    """
+    entry.delete(0, tk.END)
+    entry.insert(0, text)
+
+
+def hide_dialog(dialog, parent):
+    """Withdraw a reusable dialog and hand the modal grab back to its parent.
+
+    Args:
+        dialog: The Toplevel dialog window to hide
+        parent: The parent window that had the grab before the dialog opened
+    """
+    dialog.grab_release()
+    dialog.withdraw()
+    if parent.winfo_exists():
+        parent.grab_set()
+
+
 class InstanceManagerDialog:
     """Dialog for managing multiple BlueStacks instances"""
 
@@ -67,6 +118,13 @@ class InstanceManagerDialog:
         # Variables
         self.current_instance_id = None
         self.instances = []
+        self._instances_by_id = {}
+
+        # Last state applied to each action button, to skip no-op reconfigures
+        self._button_states = {}
+
+        # True while a coalesced selection update is queued
+        self._select_pending = False
 
         # UI Elements
         self.create_widgets()
@@ -84,20 +142,15 @@ class InstanceManagerDialog:
         list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # Treeview for instances
-        columns = ("name", "bluestacks", "port", "description")
+        columns = tuple(column_id for column_id, _, _ in _TREE_COLUMNS)
         self.tree = ttk.Treeview(list_frame, columns=columns, show="headings", selectmode="browse")
 
-        # Define headings
-        self.tree.heading("name", text="Name")
-        self.tree.heading("bluestacks", text="BlueStacks Instance")
-        self.tree.heading("port", text="ADB Port")
-        self.tree.heading("description", text="Description")
-
-        # Define columns
-        self.tree.column("name", width=150)
-        self.tree.column("bluestacks", width=150)
-        self.tree.column("port", width=80)
-        self.tree.column("description", width=200)
+        # Define headings and columns
+        heading = self.tree.heading
+        column = self.tree.column
+        for column_id, label, width in _TREE_COLUMNS:
+            heading(column_id, text=label)
+            column(column_id, width=width)
 
         # Scrollbar
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
@@ -108,7 +161,7 @@ class InstanceManagerDialog:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Bind selection event
-        self.tree.bind("<<TreeviewSelect>>", self.on_instance_select)
+        self.tree.bind("<<TreeviewSelect>>", self._queue_instance_select)
 
         # Buttons frame
         buttons_frame = ttk.Frame(main_frame)
@@ -141,13 +194,13 @@ class InstanceManagerDialog:
         self.cancel_button.pack(side=tk.RIGHT, padx=5)
 
     def load_instances(self):
-        """Load instances into treeview"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """Load all instances into treeview (on open; edits update single rows)"""
+        # Clear existing items in one call
+        self.tree.delete(*self.tree.get_children())
 
         # Get instances from manager
         self.instances = self.instance_manager.get_all_instances()
+        self._instances_by_id = {instance["id"]: instance for instance in self.instances}
 
         # Get current instance
         current_instance = self.instance_manager.get_current_instance()
@@ -155,62 +208,100 @@ class InstanceManagerDialog:
             self.current_instance_id = current_instance["id"]
 
         # Add instances to treeview
-        for instance in self.instances:
-            values = (
-                instance["name"],
-                instance["bluestacks_instance"],
-                instance["adb_port"],
-                instance["description"]
-            )
-            item_id = self.tree.insert("", tk.END, values=values)
+        rows = [(instance["id"], _row_values(instance)) for instance in self.instances]
+        insert = self.tree.insert
+        for item_id, values in rows:
+            insert("", tk.END, iid=item_id, values=values)
+
+        # Select current instance, or the first item if there is no current one
+        if self.current_instance_id in self._instances_by_id:
+            self.tree.selection_set(self.current_instance_id)
+        elif rows:
+            self.tree.selection_set(rows[0][0])
+            self.on_instance_select(None)  # Trigger selection event
 
-            # Select current instance
-            if instance["id"] == self.current_instance_id:
-                self.tree.selection_set(item_id)
+    def _add_row(self, instance_id):
+        """Append a newly created instance to the list and select it"""
+        instance = self.instance_manager.get_instance(instance_id)
+        if not instance:
+            return
 
-        # If we have a current instance but it wasn't selected, select the first item
-        if not self.tree.selection() and self.tree.get_children():
-            self.tree.selection_set(self.tree.get_children()[0])
-            self.on_instance_select(None)  # Trigger selection event
+        self.instances.append(instance)
+        self._instances_by_id[instance_id] = instance
+        self.tree.insert("", tk.END, iid=instance_id, values=_row_values(instance))
+
+        self.tree.selection_set(instance_id)
+        self.tree.see(instance_id)
+        self.on_instance_select(None)
+
+    def _update_row(self, instance_id):
+        """Refresh the row of an edited instance"""
+        instance = self.instance_manager.get_instance(instance_id)
+        if not instance:
+            return
+
+        self._instances_by_id[instance_id] = instance
+        self.instances = [instance if item["id"] == instance_id else item for item in self.instances]
+        self.tree.item(instance_id, values=_row_values(instance))
+
+    def _remove_row(self, instance_id):
+        """Remove a deleted instance's row and select the current instance"""
+        self._instances_by_id.pop(instance_id, None)
+        self.instances = [item for item in self.instances if item["id"] != instance_id]
+        self.tree.delete(instance_id)
+
+        current_instance = self.instance_manager.get_current_instance()
+        if current_instance and self.tree.exists(current_instance["id"]):
+            self.tree.selection_set(current_instance["id"])
+        self.on_instance_select(None)
 
     def get_selected_instance_id(self):
-        """Get the ID of the currently selected instance"""
+        """Get the ID of the currently selected instance (rows use the instance ID as item ID)"""
         selection = self.tree.selection()
-        if not selection:
-            return None
+        return selection[0] if selection else None
 
-        item = selection[0]
-        idx = self.tree.index(item)
-
-        if idx < 0 or idx >= len(self.instances):
-            return None
+    def _queue_instance_select(self, event):
+        """Coalesce bursts of selection events (e.g. a held arrow key) into one update"""
+        if self._select_pending:
+            return
+        self._select_pending = True
+        self.dialog.after_idle(self._flush_instance_select)
 
-        return self.instances[idx]["id"]
+    def _flush_instance_select(self):
+        """Run the queued selection update"""
+        self._select_pending = False
+        if self.dialog.winfo_exists():
+            self.on_instance_select(None)
 
     def on_instance_select(self, event):
         """Handle instance selection"""
         instance_id = self.get_selected_instance_id()
 
         if instance_id:
-            self.edit_button.config(state=tk.NORMAL)
-            self.duplicate_button.config(state=tk.NORMAL)
-            self.select_button.config(state=tk.NORMAL)
+            self._set_button_state(self.edit_button, tk.NORMAL)
+            self._set_button_state(self.duplicate_button, tk.NORMAL)
+            self._set_button_state(self.select_button, tk.NORMAL)
 
             # Only enable delete if there's more than one instance
             if len(self.instances) > 1:
-                self.delete_button.config(state=tk.NORMAL)
+                self._set_button_state(self.delete_button, tk.NORMAL)
             else:
-                self.delete_button.config(state=tk.DISABLED)
+                self._set_button_state(self.delete_button, tk.DISABLED)
         else:
-            self.edit_button.config(state=tk.DISABLED)
-            self.duplicate_button.config(state=tk.DISABLED)
-            self.select_button.config(state=tk.DISABLED)
-            self.delete_button.config(state=tk.DISABLED)
+            self._set_button_state(self.edit_button, tk.DISABLED)
+            self._set_button_state(self.duplicate_button, tk.DISABLED)
+            self._set_button_state(self.select_button, tk.DISABLED)
+            self._set_button_state(self.delete_button, tk.DISABLED)
+
+    def _set_button_state(self, button, state):
+        """Configure a button's state only if it differs from the last one applied"""
+        if self._button_states.get(button) != state:
+            button.config(state=state)
+            self._button_states[button] = state
 
     def on_new_instance(self):
         """Create a new instance"""
-        dialog = InstanceEditDialog(self.dialog, "New Instance", callback=self.on_instance_created)
-        self.dialog.wait_window(dialog.dialog)
+        InstanceEditDialog.show(self.dialog, "New Instance", callback=self.on_instance_created)
 
     def on_instance_created(self, name, bluestacks_instance, adb_port, description):
         """Callback when a new instance is created"""
@@ -223,17 +314,9 @@ class InstanceManagerDialog:
             )
 
             if instance_id:
-                self.load_instances()
-
-                # Select the new instance
-                for i, instance in enumerate(self.instances):
-                    if instance["id"] == instance_id:
-                        item = self.tree.get_children()[i]
-                        self.tree.selection_set(item)
-                        self.on_instance_select(None)
-                        break
+                self._add_row(instance_id)
         except Exception as e:
-            self.logger.error(f"Error creating instance: {e}")
+            self.logger.exception("Error creating instance: %s", e)
             messagebox.showerror("Error", f"Failed to create instance: {e}")
 
     def on_edit_instance(self):
@@ -247,7 +330,7 @@ class InstanceManagerDialog:
             messagebox.showerror("Error", "Instance not found")
             return
 
-        dialog = InstanceEditDialog(
+        InstanceEditDialog.show(
             self.dialog,
             "Edit Instance",
             name=instance["name"],
@@ -256,7 +339,6 @@ class InstanceManagerDialog:
             description=instance["description"],
             callback=lambda name, bs, port, desc: self.on_instance_updated(instance_id, name, bs, port, desc)
         )
-        self.dialog.wait_window(dialog.dialog)
 
     def on_instance_updated(self, instance_id, name, bluestacks_instance, adb_port, description):
         """Callback when an instance is updated"""
@@ -270,9 +352,9 @@ class InstanceManagerDialog:
             )
 
             if success:
-                self.load_instances()
+                self._update_row(instance_id)
         except Exception as e:
-            self.logger.error(f"Error updating instance: {e}")
+            self.logger.exception("Error updating instance: %s", e)
             messagebox.showerror("Error", f"Failed to update instance: {e}")
 
     def on_duplicate_instance(self):
@@ -288,9 +370,8 @@ class InstanceManagerDialog:
 
         # Ask for a new name
         new_name = f"Copy of {instance['name']}"
-        dialog = InstanceNameDialog(self.dialog, "Duplicate Instance", new_name,
-                                    lambda name: self.on_instance_duplicated(instance_id, name))
-        self.dialog.wait_window(dialog.dialog)
+        InstanceNameDialog.show(self.dialog, "Duplicate Instance", new_name,
+                                lambda name: self.on_instance_duplicated(instance_id, name))
 
     def on_instance_duplicated(self, instance_id, new_name):
         """Callback when an instance is duplicated"""
@@ -298,17 +379,9 @@ class InstanceManagerDialog:
             new_instance_id = self.instance_manager.duplicate_instance(instance_id, new_name)
 
             if new_instance_id:
-                self.load_instances()
-
-                # Select the new instance
-                for i, instance in enumerate(self.instances):
-                    if instance["id"] == new_instance_id:
-                        item = self.tree.get_children()[i]
-                        self.tree.selection_set(item)
-                        self.on_instance_select(None)
-                        break
+                self._add_row(new_instance_id)
         except Exception as e:
-            self.logger.error(f"Error duplicating instance: {e}")
+            self.logger.exception("Error duplicating instance: %s", e)
             messagebox.showerror("Error", f"Failed to duplicate instance: {e}")
 
     def on_delete_instance(self):
@@ -328,9 +401,9 @@ class InstanceManagerDialog:
                 success = self.instance_manager.delete_instance(instance_id)
 
                 if success:
-                    self.load_instances()
+                    self._remove_row(instance_id)
             except Exception as e:
-                self.logger.error(f"Error deleting instance: {e}")
+                self.logger.exception("Error deleting instance: %s", e)
                 messagebox.showerror("Error", f"Failed to delete instance: {e}")
 
     def on_select(self):
@@ -356,6 +429,32 @@ class InstanceManagerDialog:
 class InstanceEditDialog:
     """Dialog for editing instance details"""
 
+    # Hidden dialog kept for reuse by show()
+    _pool = None
+
+    @classmethod
+    def show(cls, parent, title, name="", bluestacks_instance="Nougat64", adb_port="5555",
+             description="", callback=None):
+        """
+        Open the dialog, reusing the hidden one from the last open when it belongs to the same parent.
+
+        Returns:
+            InstanceEditDialog: The dialog being shown
+        """
+        pooled = cls._pool
+        if pooled is None or pooled.parent is not parent or not pooled.dialog.winfo_exists():
+            cls._pool = cls(parent, title, name, bluestacks_instance, adb_port, description, callback)
+            return cls._pool
+
+        pooled.callback = callback
+        set_entry_text(pooled.name_entry, name)
+        set_entry_text(pooled.bs_instance_entry, bluestacks_instance)
+        set_entry_text(pooled.adb_port_entry, adb_port)
+        set_entry_text(pooled.description_entry, description)
+        reopen_dialog(pooled.dialog, title, 400, 250)
+        pooled.name_entry.focus_set()
+        return pooled
+
     def __init__(self, parent, title, name="", bluestacks_instance="Nougat64", adb_port="5555",
                  description="", callback=None):
         self.parent = parent
@@ -372,14 +471,15 @@ class InstanceEditDialog:
         # Dialog was closed via window close button
         self.dialog.protocol("WM_DELETE_WINDOW", self.on_cancel)
 
-        # Variables
-        self.name_var = tk.StringVar(value=name)
-        self.bs_instance_var = tk.StringVar(value=bluestacks_instance)
-        self.adb_port_var = tk.StringVar(value=adb_port)
-        self.description_var = tk.StringVar(value=description)
+        # Drop the pooled dialog once it is destroyed along with its parent
+        self.dialog.bind("<Destroy>", self.on_destroy)
 
-        # Create widgets
+        # Create widgets, then fill in the initial values
         self.create_widgets()
+        set_entry_text(self.name_entry, name)
+        set_entry_text(self.bs_instance_entry, bluestacks_instance)
+        set_entry_text(self.adb_port_entry, adb_port)
+        set_entry_text(self.description_entry, description)
 
     def create_widgets(self):
         # Main frame
@@ -388,16 +488,20 @@ class InstanceEditDialog:
 
         # Form fields
         ttk.Label(frame, text="Instance Name:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        ttk.Entry(frame, textvariable=self.name_var, width=30).grid(row=0, column=1, sticky=tk.W, pady=5)
+        self.name_entry = ttk.Entry(frame, width=30)
+        self.name_entry.grid(row=0, column=1, sticky=tk.W, pady=5)
 
         ttk.Label(frame, text="BlueStacks Instance:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        ttk.Entry(frame, textvariable=self.bs_instance_var, width=30).grid(row=1, column=1, sticky=tk.W, pady=5)
+        self.bs_instance_entry = ttk.Entry(frame, width=30)
+        self.bs_instance_entry.grid(row=1, column=1, sticky=tk.W, pady=5)
 
         ttk.Label(frame, text="ADB Port:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        ttk.Entry(frame, textvariable=self.adb_port_var, width=10).grid(row=2, column=1, sticky=tk.W, pady=5)
+        self.adb_port_entry = ttk.Entry(frame, width=10)
+        self.adb_port_entry.grid(row=2, column=1, sticky=tk.W, pady=5)
 
         ttk.Label(frame, text="Description:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        ttk.Entry(frame, textvariable=self.description_var, width=30).grid(row=3, column=1, sticky=tk.W, pady=5)
+        self.description_entry = ttk.Entry(frame, width=30)
+        self.description_entry.grid(row=3, column=1, sticky=tk.W, pady=5)
 
         # Buttons
         button_frame = ttk.Frame(frame)
@@ -408,10 +512,10 @@ class InstanceEditDialog:
 
     def on_save(self):
         """Save changes and close dialog"""
-        name = self.name_var.get().strip()
-        bs_instance = self.bs_instance_var.get().strip()
-        adb_port = self.adb_port_var.get().strip()
-        description = self.description_var.get().strip()
+        name = self.name_entry.get().strip()
+        bs_instance = self.bs_instance_entry.get().strip()
+        adb_port = self.adb_port_entry.get().strip()
+        description = self.description_entry.get().strip()
 
         # Validate fields
         if not name:
@@ -430,16 +534,43 @@ class InstanceEditDialog:
         if self.callback:
             self.callback(name, bs_instance, adb_port, description)
 
-        self.dialog.destroy()
+        hide_dialog(self.dialog, self.parent)
 
     def on_cancel(self):
-        """Cancel and close dialog"""
-        self.dialog.destroy()
+        """Cancel and close dialog (kept hidden for reuse)"""
+        hide_dialog(self.dialog, self.parent)
+
+    def on_destroy(self, event):
+        """Forget the pooled dialog when its window is destroyed"""
+        if event.widget is self.dialog and type(self)._pool is self:
+            type(self)._pool = None
 
 
 class InstanceNameDialog:
     """Simple dialog to get a new instance name"""
 
+    # Hidden dialog kept for reuse by show()
+    _pool = None
+
+    @classmethod
+    def show(cls, parent, title, default_name="", callback=None):
+        """
+        Open the dialog, reusing the hidden one from the last open when it belongs to the same parent.
+
+        Returns:
+            InstanceNameDialog: The dialog being shown
+        """
+        pooled = cls._pool
+        if pooled is None or pooled.parent is not parent or not pooled.dialog.winfo_exists():
+            cls._pool = cls(parent, title, default_name, callback)
+            return cls._pool
+
+        pooled.callback = callback
+        set_entry_text(pooled.name_entry, default_name)
+        reopen_dialog(pooled.dialog, title, 300, 120)
+        pooled.name_entry.focus_set()
+        return pooled
+
     def __init__(self, parent, title, default_name="", callback=None):
         self.parent = parent
         self.callback = callback
@@ -455,11 +586,12 @@ class InstanceNameDialog:
         # Dialog was closed via window close button
         self.dialog.protocol("WM_DELETE_WINDOW", self.on_cancel)
 
-        # Variables
-        self.name_var = tk.StringVar(value=default_name)
+        # Drop the pooled dialog once it is destroyed along with its parent
+        self.dialog.bind("<Destroy>", self.on_destroy)
 
-        # Create widgets
+        # Create widgets, then fill in the initial value
         self.create_widgets()
+        set_entry_text(self.name_entry, default_name)
 
     def create_widgets(self):
         # Main frame
@@ -468,9 +600,9 @@ class InstanceNameDialog:
 
         # Name field
         ttk.Label(frame, text="New Instance Name:").pack(anchor=tk.W, pady=5)
-        name_entry = ttk.Entry(frame, textvariable=self.name_var, width=30)
-        name_entry.pack(fill=tk.X, pady=5)
-        name_entry.focus_set()  # Set focus to entry field
+        self.name_entry = ttk.Entry(frame, width=30)
+        self.name_entry.pack(fill=tk.X, pady=5)
+        self.name_entry.focus_set()  # Set focus to entry field
 
         # Buttons
         button_frame = ttk.Frame(frame)
@@ -481,7 +613,7 @@ class InstanceNameDialog:
 
     def on_ok(self):
         """Save name and close dialog"""
-        name = self.name_var.get().strip()
+        name = self.name_entry.get().strip()
 
         # Validate name
         if not name:
@@ -492,11 +624,16 @@ class InstanceNameDialog:
         if self.callback:
             self.callback(name)
 
-        self.dialog.destroy()
+        hide_dialog(self.dialog, self.parent)
 
     def on_cancel(self):
-        """Cancel and close dialog"""
-        self.dialog.destroy()
+        """Cancel and close dialog (kept hidden for reuse)"""
+        hide_dialog(self.dialog, self.parent)
+
+    def on_destroy(self, event):
+        """Forget the pooled dialog when its window is destroyed"""
+        if event.widget is self.dialog and type(self)._pool is self:
+            type(self)._pool = None
 
 
 # Test function
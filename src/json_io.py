@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+JSON I/O - Fast JSON parsing and serialization for the app's data files.
+
+orjson parses straight from bytes and is much faster; the stdlib json module
+is used when it is not installed. Both functions work with bytes so callers
+can read and write files in binary mode either way.
+"""
+import json
+
+try:
+    import orjson
+
+    def json_loads(data):
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def json_dumps(obj):
+        """Serialize obj to indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def json_loads(data):
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+
+    def json_dumps(obj):
+        """Serialize obj to indented JSON bytes."""
+        return json.dumps(obj, indent=2).encode("utf-8")
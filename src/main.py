@@ -1,30 +1,40 @@
 #!/usr/bin/env python3
 import os
+import queue
+import atexit
 import logging
+import logging.handlers
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import ttk, messagebox
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 
 def setup_environment():
     """Setup environment, create necessary directories and check dependencies"""
-    # Create logs directory if not exists
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
-
-    # Create instances directory if not exists
-    if not os.path.exists("instances"):
-        os.makedirs("instances")
-
-    # Setup logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler("logs/rok_automation.log"),
-            logging.StreamHandler()
-        ]
-    )
+    # Create logs and instances directories if not exists
+    os.makedirs("logs", exist_ok=True)
+    os.makedirs("instances", exist_ok=True)
+
+    # Setup logging (only once; opening the log file again would leak a handle).
+    # Records are queued and written by a background listener, so logging
+    # never blocks the UI thread on file or console I/O.
+    if not logging.getLogger().handlers:
+        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        file_handler = logging.FileHandler("logs/rok_automation.log")
+        stream_handler = logging.StreamHandler()
+        for handler in (file_handler, stream_handler):
+            handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler,
+                                                  respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
     logger = logging.getLogger(__name__)
     logger.info("Starting Rise of Kingdoms Automation Tool")
 
@@ -33,9 +43,7 @@ def setup_environment():
 
 def main():
     """Main entry point of the application"""
-    logger = setup_environment()
-
-    # Parse command line arguments
+    # Parse command line arguments (before setup, so --help touches nothing on disk)
     parser = argparse.ArgumentParser(description="Rise of Kingdoms Automation Tool")
     parser.add_argument("--single", action="store_true", help="Launch single instance mode")
     parser.add_argument("--multi", action="store_true", help="Launch multi-instance mode (default)")
@@ -46,22 +54,42 @@ def main():
     if args.multi:
         use_single_mode = False
 
+    logger = setup_environment()
+
+    # Load the instance index on a worker thread while the window comes up
+    from instance_manager import get_instance_manager
+    executor = ThreadPoolExecutor(max_workers=1)
+    instance_manager_future = executor.submit(get_instance_manager)
+    executor.shutdown(wait=False)
+
+    # Show the window right away; the heavy GUI modules are imported once it has painted
+    root = tk.Tk()
+    root.title("Rise of Kingdoms Automation")
+    loading_label = ttk.Label(root, text="Loading…", padding=40)
+    loading_label.pack()
+
+    root.after_idle(_finish_init, root, loading_label, use_single_mode, instance_manager_future, logger)
+
+    # Start the main loop
+    root.mainloop()
+
+
+def _finish_init(root, loading_label, use_single_mode, instance_manager_future, logger):
+    """Import the selected GUI and build it in the already visible root window"""
     try:
         # Import modules here to catch any import errors
         if use_single_mode:
-            from bluestacks_manager_gui import RiseOfKingdomsManagerGUI
+            from bluestacks_manager_gui import RiseOfKingdomsManagerGUI as AppClass
             logger.info("Starting in single instance mode")
-
-            # Create the main application window
-            root = tk.Tk()
-            app = RiseOfKingdomsManagerGUI(root)
         else:
-            from multi_instance_manager_gui import MultiInstanceManagerGUI
+            from multi_instance_manager_gui import MultiInstanceManagerGUI as AppClass
             logger.info("Starting in multi-instance mode")
 
-            # Create the multi-instance manager window
-            root = tk.Tk()
-            app = MultiInstanceManagerGUI(root)
+        instance_manager = instance_manager_future.result()
+
+        # Create the application in the root window
+        loading_label.destroy()
+        root.app = AppClass(root, instance_manager=instance_manager)
 
         # Set window icon if available
         try:
@@ -69,19 +97,17 @@ def main():
         except:
             logger.warning("Could not load application icon")
 
-        # Start the main loop
-        root.mainloop()
-
     except ImportError as e:
-        logger.error(f"Failed to import required modules: {e}")
+        logger.error("Failed to import required modules: %s", e)
         messagebox.showerror("Import Error",
                              f"Failed to import required modules: {e}\n\n"
                              "Please make sure all dependencies are installed.\n"
                              "Run: pip install -r requirements.txt")
+        root.destroy()
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        logger.exception("Stack trace:")
+        logger.exception("Unexpected error: %s", e)
         messagebox.showerror("Error", f"An unexpected error occurred: {e}")
+        root.destroy()
 
 
 if __name__ == "__main__":
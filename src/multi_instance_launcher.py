@@ -1,44 +1,254 @@
 #!/usr/bin/env python3
 import os
 import sys
+import copy
 import time
+import signal
 import logging
 import threading
 import subprocess
-import tkinter as tk
-from tkinter import ttk, messagebox
-from queue import Queue
+from queue import Queue, Full, Empty
 
 from instance_manager import InstanceManager
 from config_manager import ConfigManager
-from bluestacks_controller import BlueStacksController
+from bluestacks_controller import BlueStacksController, NO_WINDOW_FLAGS
 from rok_game_controller import RoKGameController
 from daily_task_tracker import DailyTaskTracker, get_tracker_path_for_instance
 
+# Most messages the launcher queue holds before the oldest are discarded
+MAX_QUEUED_MESSAGES = 10000
+
+# Loggers of the automation modules whose records are shown in the GUI
+AUTOMATION_LOGGERS = frozenset({
+    'recovery_manager',
+    'character_switcher',
+    'build_automation',
+    'donation_automation',
+    'expedition_automation',
+    'screen_detector',
+    'bluestacks_controller',
+    'rok_game_controller',
+    'ocr_helper',
+})
+
+
+def _enum_hd_player_pids(instance_name):
+    """
+    Find HD-Player.exe processes whose command line mentions an instance name (Windows only).
+
+    Walks a Toolhelp32 process snapshot and reads each HD-Player command line
+    with NtQueryInformationProcess, so no subprocess (WMIC/PowerShell) is started.
+
+    Args:
+        instance_name: BlueStacks instance name to match in the command line (case-insensitive)
+
+    Returns:
+        list: Matching process IDs
+
+    Raises:
+        OSError: If the process snapshot cannot be taken
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    PROCESS_COMMAND_LINE_INFORMATION = 60
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [("dwSize", wintypes.DWORD),
+                    ("cntUsage", wintypes.DWORD),
+                    ("th32ProcessID", wintypes.DWORD),
+                    ("th32DefaultHeapID", ctypes.c_size_t),
+                    ("th32ModuleID", wintypes.DWORD),
+                    ("cntThreads", wintypes.DWORD),
+                    ("th32ParentProcessID", wintypes.DWORD),
+                    ("pcPriClassBase", ctypes.c_long),
+                    ("dwFlags", wintypes.DWORD),
+                    ("szExeFile", wintypes.WCHAR * 260)]
+
+    class UNICODE_STRING(ctypes.Structure):
+        _fields_ = [("Length", wintypes.USHORT),
+                    ("MaximumLength", wintypes.USHORT),
+                    ("Buffer", ctypes.c_void_p)]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    ntdll = ctypes.WinDLL("ntdll")
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    ntdll.NtQueryInformationProcess.argtypes = [wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p,
+                                                wintypes.ULONG, ctypes.POINTER(wintypes.ULONG)]
+    ntdll.NtQueryInformationProcess.restype = ctypes.c_long
+
+    def command_line(pid):
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return ""
+        try:
+            # The first call only reports the buffer size needed
+            size = wintypes.ULONG(0)
+            ntdll.NtQueryInformationProcess(handle, PROCESS_COMMAND_LINE_INFORMATION, None, 0,
+                                            ctypes.byref(size))
+            if not size.value:
+                return ""
+            buffer = ctypes.create_string_buffer(size.value)
+            status = ntdll.NtQueryInformationProcess(handle, PROCESS_COMMAND_LINE_INFORMATION, buffer,
+                                                     size.value, ctypes.byref(size))
+            if status < 0:
+                return ""
+            text = UNICODE_STRING.from_buffer(buffer)
+            return ctypes.wstring_at(text.Buffer, text.Length // 2) if text.Buffer else ""
+        finally:
+            kernel32.CloseHandle(handle)
+
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    pids = []
+    needle = instance_name.lower()
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if (entry.szExeFile.lower() == "hd-player.exe"
+                    and needle in command_line(entry.th32ProcessID).lower()):
+                pids.append(entry.th32ProcessID)
+            found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+
+    return pids
+
+
+def put_drop_oldest(message_queue, item):
+    """
+    Queue an item without blocking, discarding the oldest queued item if the queue is full.
+
+    The shutdown sentinel (None) is never discarded; the new item is dropped instead.
+
+    Args:
+        message_queue: Bounded Queue to put the item on
+        item: Item to queue
+    """
+    while True:
+        try:
+            message_queue.put_nowait(item)
+            return
+        except Full:
+            try:
+                dropped = message_queue.get_nowait()
+            except Empty:
+                continue
+            message_queue.task_done()
+            if dropped is None:
+                message_queue.put_nowait(None)
+                return
+
 
 class QueueLogHandler(logging.Handler):
     """
     Custom logging handler that routes log messages to a queue for GUI display.
     This allows verbose logs from all automation modules to appear in the GUI.
+
+    Records are batched: one "log_batch" queue item is sent per BATCH_SIZE
+    records or FLUSH_INTERVAL seconds after the first buffered record, whichever
+    comes first. A single flusher thread per handler sends partial batches and
+    sleeps while the buffer is empty.
+
+    Like logging.handlers.QueueHandler.prepare, emit merges each record's
+    args into its message (and renders any traceback) right away, so later
+    changes to the arguments do not show up in the log. The launcher applies
+    RECORD_FORMATTER on the consumer side.
     """
 
+    RECORD_FORMATTER = logging.Formatter('%(name)s - %(message)s')
+
+    BATCH_SIZE = 100
+    FLUSH_INTERVAL = 0.05
+
     def __init__(self, queue, instance_id):
         super().__init__()
         self.queue = queue
         self.instance_id = instance_id
-        self.setFormatter(logging.Formatter('%(name)s - %(message)s'))
+
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._pending = threading.Event()  # Set when the buffer gets its first record
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+
+    def prepare(self, record):
+        """
+        Snapshot a record's message so it can be formatted later on another thread.
+
+        Args:
+            record: LogRecord to prepare
+
+        Returns:
+            LogRecord: Prepared copy, leaving the original intact for other handlers
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Keep the traceback text but not the frames it references
+            record.exc_text = self.RECORD_FORMATTER.formatException(record.exc_info)
+        record.exc_info = None
+        return record
 
     def emit(self, record):
         try:
-            msg = self.format(record)
-            self.queue.put({
-                "instance_id": self.instance_id,
-                "type": "log",
-                "message": msg
-            })
+            record = self.prepare(record)
+            with self._buffer_lock:
+                self._buffer.append(record)
+                if len(self._buffer) == 1:
+                    self._pending.set()
+                if len(self._buffer) >= self.BATCH_SIZE:
+                    self._send_buffer()
         except Exception:
             self.handleError(record)
 
+    def flush(self):
+        """Send all buffered records as one queue item."""
+        with self._buffer_lock:
+            self._send_buffer()
+
+    def _send_buffer(self):
+        """Queue the buffered records as one item. The caller holds _buffer_lock."""
+        # Queuing under the lock keeps batches in order with messages put right after a flush()
+        if self._buffer:
+            records, self._buffer = self._buffer, []
+            put_drop_oldest(self.queue, {
+                "instance_id": self.instance_id,
+                "type": "log_batch",
+                "records": records
+            })
+
+    def _flush_periodically(self):
+        """Send each partial batch FLUSH_INTERVAL seconds after it starts, until the handler is closed."""
+        while True:
+            self._pending.wait()
+            if self._stop_flusher.wait(self.FLUSH_INTERVAL):
+                return
+            with self._buffer_lock:
+                self._pending.clear()
+                self._send_buffer()
+
+    def close(self):
+        self._stop_flusher.set()
+        self._pending.set()  # Wake the flusher so it can exit
+        self.flush()
+        super().close()
+
 
 class AutomationThread(threading.Thread):
     """Thread class for running automation on a specific instance"""
@@ -57,27 +267,54 @@ class AutomationThread(threading.Thread):
         self.force_daily_tasks = force_daily_tasks  # Whether to run daily tasks even if completed today
         self.instances_dir = instances_dir  # Directory containing instance configs
         self.on_complete_callback = on_complete_callback  # Callback when thread completes
+        self._last_status = None  # Last status sent, to drop repeated updates
+        self._queue_handler = None  # Batches module logs for the GUI while run() is active
 
         # Set up logging
         self.logger = logging.getLogger(f"automation.{instance_id}")
 
+    def _flush_module_logs(self):
+        """Send buffered module log records first, so the GUI shows them in order."""
+        if self._queue_handler:
+            self._queue_handler.flush()
+
     def log(self, message):
         """Add log message to queue and logger"""
         self.logger.info(message)
-        self.queue.put({
+        self._flush_module_logs()
+        put_drop_oldest(self.queue, {
             "instance_id": self.instance_id,
             "type": "log",
             "message": message
         })
 
     def update_status(self, status):
-        """Update status in queue"""
-        self.queue.put({
+        """Update status in queue (repeats of the current status are dropped)"""
+        if status == self._last_status:
+            return
+        self._last_status = status
+        self._flush_module_logs()
+        put_drop_oldest(self.queue, {
             "instance_id": self.instance_id,
             "type": "status",
             "message": status
         })
 
+    def find_bluestacks_pids(self, bs_instance_name):
+        """
+        Find the HD-Player.exe process IDs of a BlueStacks instance (Windows only).
+
+        Args:
+            bs_instance_name: BlueStacks instance name to match in the command line
+
+        Returns:
+            list: Process IDs (empty if the instance is not running)
+
+        Raises:
+            OSError: If the process list cannot be read
+        """
+        return _enum_hd_player_pids(bs_instance_name)
+
     def close_bluestacks(self, bluestacks_controller):
         """Close the specific BlueStacks instance without affecting other instances or restarting them"""
         try:
@@ -87,14 +324,13 @@ class AutomationThread(threading.Thread):
             self.log(f"Closing BlueStacks instance: {bs_instance_name}")
 
             # First check if the instance is actually running before trying to interact with it
+            # The PIDs found here are reused for the kill below, so the process list is queried once
             is_running = False
+            instance_pids = None
             if sys.platform == "win32":
-                check_instance_cmd = f'wmic process where "name=\'HD-Player.exe\' and commandline like \'%{bs_instance_name}%\'" get processid'
                 try:
-                    process_info = subprocess.run(check_instance_cmd, shell=True, capture_output=True, text=True,
-                                                  timeout=5)
-                    process_output = process_info.stdout.strip()
-                    is_running = 'ProcessId' in process_output and len(process_output.split('\n')) > 1
+                    instance_pids = self.find_bluestacks_pids(bs_instance_name)
+                    is_running = bool(instance_pids)
                 except Exception as e:
                     self.log(f"Error checking if instance is running: {e}")
                     # Assume it might be running to be safe
@@ -111,35 +347,37 @@ class AutomationThread(threading.Thread):
                     package_name = self.config_manager.get_config('RiseOfKingdoms', 'package_name',
                                                                   'com.lilithgame.roc.gp')
                     adb_device = bluestacks_controller.adb_device
-                    force_stop_cmd = f'"{bluestacks_controller.adb_path}" -s {adb_device} shell am force-stop {package_name}'
-                    self.log(f"Stopping RoK app with command: {force_stop_cmd}")
-                    subprocess.run(force_stop_cmd, shell=True, capture_output=True, timeout=10)
-
-                    # Add a delay to ensure app is fully stopped
-                    time.sleep(2)
+                    force_stop_cmd = [bluestacks_controller.adb_path, '-s', adb_device,
+                                      'shell', 'am', 'force-stop', package_name]
+                    self.log(f"Stopping RoK app with command: {subprocess.list2cmdline(force_stop_cmd)}")
+                    subprocess.run(force_stop_cmd, capture_output=True, timeout=10,
+                                   creationflags=NO_WINDOW_FLAGS)
+
+                    # Wait until the app process is gone (at most 2 seconds) instead of a fixed sleep
+                    deadline = time.monotonic() + 2
+                    while (bluestacks_controller.is_app_running(package_name)
+                           and time.monotonic() < deadline):
+                        time.sleep(0.5)
                 except Exception as e:
                     self.log(f"Error force stopping RoK app: {e}")
 
             # Now directly kill the process for the specific instance
             if sys.platform == "win32" and is_running:
-                # Find and kill the specific BlueStacks instance process
-                check_instance_cmd = f'wmic process where "name=\'HD-Player.exe\' and commandline like \'%{bs_instance_name}%\'" get processid'
+                # Kill the specific BlueStacks instance process(es)
                 try:
-                    process_info = subprocess.run(check_instance_cmd, shell=True, capture_output=True, text=True,
-                                                  timeout=5)
-                    process_output = process_info.stdout.strip()
-
-                    # Extract and kill PIDs
-                    if 'ProcessId' in process_output:
-                        lines = process_output.split('\n')
-                        for line in lines[1:]:  # Skip header line
-                            if line.strip():
-                                pid = line.strip()
-                                self.log(f"Found process ID for instance {bs_instance_name}: {pid}")
-                                # Kill this specific PID
-                                kill_cmd = f'taskkill /F /PID {pid}'
-                                self.log(f"Killing process with command: {kill_cmd}")
-                                subprocess.run(kill_cmd, shell=True, capture_output=True, timeout=5)
+                    if instance_pids is None:
+                        # The earlier lookup failed; try once more
+                        instance_pids = self.find_bluestacks_pids(bs_instance_name)
+
+                    if instance_pids:
+                        for pid in instance_pids:
+                            self.log(f"Found process ID for instance {bs_instance_name}: {pid}")
+                            # Kill this specific PID (TerminateProcess on Windows, like taskkill /F)
+                            self.log(f"Killing process {pid}")
+                            try:
+                                os.kill(pid, signal.SIGTERM)
+                            except OSError as e:
+                                self.log(f"Could not kill process {pid} (may have already exited): {e}")
                     else:
                         self.log(f"No running process found for instance {bs_instance_name}")
                 except Exception as e:
@@ -147,7 +385,7 @@ class AutomationThread(threading.Thread):
             elif not sys.platform == "win32":
                 # On Linux/Mac, try to use pkill with instance name filter
                 self.log(f"Using pkill to terminate BlueStacks instance {bs_instance_name}")
-                subprocess.run(f"pkill -f 'BlueStacks.*{bs_instance_name}'", shell=True, capture_output=True,
+                subprocess.run(['pkill', '-f', f'BlueStacks.*{bs_instance_name}'], capture_output=True,
                                timeout=10)
 
             self.log(f"BlueStacks instance {bs_instance_name} closed")
@@ -159,33 +397,36 @@ class AutomationThread(threading.Thread):
             self.log(f"Failed to close BlueStacks: {e}")
             return False
 
+    def _maybe_close_bluestacks(self, bluestacks_controller):
+        """
+        Close BlueStacks if exit_after_complete is set at this moment.
+
+        The setting is read when the thread finishes, so a change made through
+        MultiInstanceLauncher.set_exit_after_complete during the run still applies.
+
+        Args:
+            bluestacks_controller: Controller of this instance, or None if it was never created
+        """
+        if self.exit_after_complete and bluestacks_controller:
+            self.log("Automation complete, closing BlueStacks instance")
+            self.close_bluestacks(bluestacks_controller)
+
     def run(self):
         """Run the automation sequence for this instance"""
         bluestacks_controller = None
+        rok_controller = None
         queue_handler = None
 
-        # List of logger names to capture for GUI display
-        automation_loggers = [
-            'recovery_manager',
-            'character_switcher',
-            'build_automation',
-            'donation_automation',
-            'expedition_automation',
-            'screen_detector',
-            'bluestacks_controller',
-            'rok_game_controller',
-            'ocr_helper',
-        ]
-
         try:
             # Set up queue handler to route verbose logs to GUI
             queue_handler = QueueLogHandler(self.queue, self.instance_id)
             queue_handler.setLevel(logging.INFO)
+            self._queue_handler = queue_handler
 
-            # Attach handler to all automation-related loggers
-            for logger_name in automation_loggers:
-                logger = logging.getLogger(logger_name)
-                logger.addHandler(queue_handler)
+            # Attach the handler once to the root logger, where the automation
+            # loggers propagate, and keep only their records
+            queue_handler.addFilter(lambda record: record.name in AUTOMATION_LOGGERS)
+            logging.getLogger().addHandler(queue_handler)
 
             self.log(f"Starting automation for instance '{self.instance_name}'")
             self.update_status("Starting")
@@ -232,9 +473,6 @@ class AutomationThread(threading.Thread):
             if self.stop_event.is_set():
                 self.log("Automation stopped after BlueStacks startup")
                 self.update_status("Stopped")
-                if self.exit_after_complete and bluestacks_controller:
-                    self.log("Closing BlueStacks instance")
-                    self.close_bluestacks(bluestacks_controller)
                 return
 
             # Connect to ADB
@@ -244,18 +482,12 @@ class AutomationThread(threading.Thread):
             if not bluestacks_controller.connect_adb():
                 self.log("Failed to connect to ADB")
                 self.update_status("Failed to connect to ADB")
-                if self.exit_after_complete and bluestacks_controller:
-                    self.log("Closing BlueStacks instance")
-                    self.close_bluestacks(bluestacks_controller)
                 return
 
             # Start Rise of Kingdoms
             if self.stop_event.is_set():
                 self.log("Automation stopped before launching game")
                 self.update_status("Stopped")
-                if self.exit_after_complete and bluestacks_controller:
-                    self.log("Closing BlueStacks instance")
-                    self.close_bluestacks(bluestacks_controller)
                 return
 
             self.log("Starting Rise of Kingdoms")
@@ -264,30 +496,17 @@ class AutomationThread(threading.Thread):
             if not rok_controller.start_game():
                 self.log("Failed to start Rise of Kingdoms")
                 self.update_status("Failed to start RoK")
-                if self.exit_after_complete and bluestacks_controller:
-                    self.log("Closing BlueStacks instance")
-                    self.close_bluestacks(bluestacks_controller)
                 return
 
             # Wait for game to load with periodic stop checks
             self.log("Waiting for Rise of Kingdoms to load")
             self.update_status("Game loading")
 
-            # Wait in intervals with stop checks
-            total_wait = rok_controller.game_load_wait_seconds
-            interval = 2  # Check for stop every 2 seconds
-
-            for _ in range(0, total_wait, interval):
-                if self.stop_event.is_set():
-                    self.log("Automation stopped during game loading")
-                    self.update_status("Stopped")
-                    if self.exit_after_complete and bluestacks_controller:
-                        self.log("Closing BlueStacks instance")
-                        self.close_bluestacks(bluestacks_controller)
-                    return
-
-                time.sleep(min(interval, total_wait))
-                total_wait -= interval
+            # Wait for the load time, waking immediately if a stop is requested
+            if self.stop_event.wait(timeout=rok_controller.game_load_wait_seconds):
+                self.log("Automation stopped during game loading")
+                self.update_status("Stopped")
+                return
 
             rok_controller.wait_for_game_load()
 
@@ -316,16 +535,21 @@ class AutomationThread(threading.Thread):
             self.log(f"Error in automation: {str(e)}")
 
         finally:
-            # Remove queue handler from all loggers to prevent memory leaks
+            # Remove queue handler from the root logger to prevent memory leaks
             if queue_handler:
-                for logger_name in automation_loggers:
-                    logger = logging.getLogger(logger_name)
-                    logger.removeHandler(queue_handler)
+                logging.getLogger().removeHandler(queue_handler)
+                queue_handler.close()  # Sends any buffered messages
+
+            # Save text positions learned during this run
+            if rok_controller:
+                rok_controller.ocr.flush_disk_cache()
 
-            # Close BlueStacks if configured to do so
-            if self.exit_after_complete and bluestacks_controller:
-                self.log("Automation complete, closing BlueStacks instance")
-                self.close_bluestacks(bluestacks_controller)
+            # Every exit path, including the early stop/failure returns, closes BlueStacks here
+            self._maybe_close_bluestacks(bluestacks_controller)
+
+            # Release the persistent adb shell (also used by the close above to poll the app)
+            if bluestacks_controller:
+                bluestacks_controller.close_shell()
 
             self.log("Automation thread completed")
 
@@ -344,8 +568,9 @@ class MultiInstanceLauncher:
         # Track running automations
         self.running_threads = {}  # {instance_id: (thread, stop_event)}
 
-        # Message queue for communication between threads
-        self.message_queue = Queue()
+        # Message queue for communication between threads; bounded so a log storm
+        # cannot grow it without limit (producers drop the oldest entries instead)
+        self.message_queue = Queue(maxsize=MAX_QUEUED_MESSAGES)
 
         # Start message processing thread
         self.is_running = True
@@ -387,23 +612,32 @@ class MultiInstanceLauncher:
             self.status_callback(instance_id, "Stopped")
 
     def _process_messages(self):
-        """Process messages from automation threads"""
-        while self.is_running:
-            try:
-                # Get message with timeout to allow checking is_running
-                message = self.message_queue.get(timeout=0.5)
+        """Process messages from automation threads until shutdown() queues the None sentinel"""
+        while True:
+            # Block until a message arrives; no periodic wakeups
+            message = self.message_queue.get()
+            if message is None:
+                self.message_queue.task_done()
+                break
 
+            try:
                 if message["type"] == "log" and self.log_callback:
                     self.log_callback(message["instance_id"], message["message"])
 
+                elif message["type"] == "log_batch" and self.log_callback:
+                    instance_id = message["instance_id"]
+                    format_record = QueueLogHandler.RECORD_FORMATTER.format
+                    for record in message["records"]:
+                        self.log_callback(instance_id, format_record(record))
+
                 elif message["type"] == "status" and self.status_callback:
                     self.status_callback(message["instance_id"], message["message"])
 
-                self.message_queue.task_done()
+            except Exception as e:
+                self.logger.exception(f"Error processing launcher message: {e}")
 
-            except Exception:
-                # Queue.Empty exception is expected
-                pass
+            finally:
+                self.message_queue.task_done()
 
     def launch_instance(self, instance_id, force_daily_tasks=False):
         """Launch automation for a specific instance"""
@@ -472,128 +706,19 @@ class MultiInstanceLauncher:
         return True
 
     def stop_all_instances(self):
-        """Stop all running instances with improved user feedback"""
-        running_instances = self.launcher.get_running_instances()
-
-        if not running_instances:
-            messagebox.showinfo("None Running", "No instances are currently running.")
-            return
+        """
+        Stop automation for all running instances.
 
-        # Confirm with user
-        result = messagebox.askyesno(
-            "Stop All",
-            f"Stop automation for {len(running_instances)} running instances?"
-        )
-
-        if not result:
-            return
-
-        # Disable Stop All button during operation
-        stop_all_button = None
-        for widget in self.root.winfo_children():
-            if isinstance(widget, ttk.Frame):
-                for child in widget.winfo_children():
-                    if isinstance(child, ttk.Frame):
-                        for button in child.winfo_children():
-                            if isinstance(button, ttk.Button) and button['text'] == "Stop All":
-                                stop_all_button = button
-                                button.config(state=tk.DISABLED)
-                                break
-
-        # Show stopping progress
-        progress_window = tk.Toplevel(self.root)
-        progress_window.title("Stopping Instances")
-        progress_window.geometry("400x200")
-        progress_window.transient(self.root)
-        progress_window.grab_set()
-
-        ttk.Label(progress_window, text=f"Stopping {len(running_instances)} instances...",
-                  font=("", 12, "bold")).pack(pady=10)
-
-        # Add progress bar
-        progress = ttk.Progressbar(progress_window, orient="horizontal", length=300, mode="determinate")
-        progress.pack(pady=10)
-        progress["maximum"] = len(running_instances)
-        progress["value"] = 0
-
-        # Status text
-        status_var = tk.StringVar(value="Initiating stop commands...")
-        ttk.Label(progress_window, textvariable=status_var).pack(pady=5)
-
-        # List of instances being stopped
-        stopping_frame = ttk.Frame(progress_window)
-        stopping_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        stopping_list = tk.Text(stopping_frame, height=5, width=40)
-        stopping_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar = ttk.Scrollbar(stopping_frame, orient=tk.VERTICAL, command=stopping_list.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        stopping_list.config(yscrollcommand=scrollbar.set)
-
-        # Stop instances one by one to provide visual feedback
-        def stop_instances_with_progress():
-            try:
-                # Get instance names for nicer display
-                instance_names = {}
-                for instance_id in running_instances:
-                    instance = self.instance_manager.get_instance(instance_id)
-                    if instance:
-                        instance_names[instance_id] = instance["name"]
-                    else:
-                        instance_names[instance_id] = f"Instance {instance_id}"
-
-                # Stop each instance with feedback
-                for i, instance_id in enumerate(running_instances):
-                    instance_name = instance_names.get(instance_id, f"Instance {instance_id}")
-
-                    # Update progress window
-                    self.root.after_idle(lambda: status_var.set(f"Stopping {instance_name}..."))
-                    self.root.after_idle(lambda: stopping_list.insert(tk.END, f"Stopping {instance_name}...\n"))
-                    self.root.after_idle(lambda: stopping_list.see(tk.END))
-                    self.root.after_idle(lambda: progress.config(value=i))
-
-                    # Stop the instance
-                    self.launcher.stop_instance(instance_id)
-
-                    # Update status in the main UI
-                    self.root.after_idle(lambda id=instance_id: self.update_instance_status(id, "Stopping"))
+        Confirmation and progress display are left to the GUI, which keeps its
+        own reference to the Stop All button.
 
-                    # Small delay for visual feedback
-                    time.sleep(0.5)
-
-                # All instances are being stopped
-                self.root.after_idle(lambda: status_var.set("All instances are stopping..."))
-                self.root.after_idle(lambda: progress.config(value=len(running_instances)))
-
-                # Wait a moment before closing the progress window
-                time.sleep(2)
-
-                # Final update to UI
-                self.root.after_idle(self.load_instances)
-                self.root.after_idle(lambda: self.on_instance_select(None))
-
-                # Re-enable the Stop All button if it exists
-                if stop_all_button:
-                    self.root.after_idle(lambda: stop_all_button.config(state=tk.NORMAL))
-
-                # Show completion message and close progress window
-                self.root.after_idle(lambda: messagebox.showinfo("Operation Complete",
-                                                                 f"Stop commands sent to {len(running_instances)} instances.\n\n"
-                                                                 "Instances will shut down shortly."))
-                self.root.after_idle(progress_window.destroy)
-
-            except Exception as e:
-                # Handle any errors
-                self.logger.error(f"Error in stop_all operation: {e}")
-                self.root.after_idle(lambda: messagebox.showerror("Error",
-                                                                  f"An error occurred while stopping instances: {str(e)}"))
-
-                # Make sure to re-enable button and close window
-                if stop_all_button:
-                    self.root.after_idle(lambda: stop_all_button.config(state=tk.NORMAL))
-                self.root.after_idle(progress_window.destroy)
-
-        # Run the stopping process in a separate thread
-        threading.Thread(target=stop_instances_with_progress, daemon=True).start()
+        Returns:
+            list: IDs of the instances that were asked to stop
+        """
+        running_instances = self.get_running_instances()
+        for instance_id in running_instances:
+            self.stop_instance(instance_id)
+        return running_instances
 
     def get_running_instances(self):
         """Get list of running instance IDs"""
@@ -611,6 +736,7 @@ class MultiInstanceLauncher:
             self.stop_instance(instance_id)
 
         self.is_running = False
+        put_drop_oldest(self.message_queue, None)  # Wake the message thread so it can exit; never blocks
 
         # Wait for message thread to terminate
         if self.message_thread.is_alive():
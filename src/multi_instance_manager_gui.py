@@ -12,7 +12,7 @@ from tkinter import ttk, messagebox
 import threading
 import time
 
-from instance_manager import InstanceManager
+from instance_manager import get_instance_manager
 from instance_manager_gui import InstanceManagerDialog
 from multi_instance_launcher import MultiInstanceLauncher
 from daily_task_tracker import DailyTaskTracker, get_tracker_path_for_instance
@@ -119,7 +119,7 @@ class StatusBadge(tk.Canvas):
 class MultiInstanceManagerGUI:
     """Modern GUI for managing and running multiple BlueStacks instances"""
 
-    def __init__(self, root):
+    def __init__(self, root, instance_manager=None):
         self.root = root
         self.root.title("RoK Multi-Instance Manager")
         self.root.geometry("1150x900")
@@ -130,8 +130,8 @@ class MultiInstanceManagerGUI:
         # Setup logging
         self.setup_logging()
 
-        # Initialize managers
-        self.instance_manager = InstanceManager()
+        # Initialize managers (main() may have built the instance manager in the background)
+        self.instance_manager = instance_manager or get_instance_manager()
         self.launcher = MultiInstanceLauncher(self.instance_manager)
 
         # Set callbacks
@@ -645,7 +645,7 @@ class MultiInstanceManagerGUI:
             # Count characters that completed at least one task today
             completed = 0
             for char_idx in range(num_characters):
-                char_data = status["characters"].get(str(char_idx), {})
+                char_data = status["characters"].get(char_idx, {})
                 # Check if any task was completed today
                 if any(date == today for date in char_data.values()):
                     completed += 1
@@ -921,24 +921,43 @@ class MultiInstanceManagerGUI:
                 instance = self.instance_manager.get_instance(instance_id)
                 name = instance["name"] if instance else instance_id
 
-                self.root.after_idle(lambda n=name: status_var.set(f"Launching {n}..."))
-                self.root.after_idle(lambda v=i: progress.config(value=v))
-
                 success = self.launcher.launch_instance(instance_id, force_daily_tasks=force_daily)
-                if success:
-                    self.root.after_idle(lambda id=instance_id: self.update_instance_status(id, "Starting"))
+
+                # One idle callback per instance applies all of its UI updates
+                self.root.after_idle(self._update_launch_progress, status_var, progress, i,
+                                     f"Launching {name}...", instance_id if success else None)
 
                 if i < len(instance_ids) - 1:
                     time.sleep(5)
 
-            self.root.after_idle(lambda: progress.config(value=len(instance_ids)))
-            self.root.after_idle(lambda: status_var.set("✓ Complete!"))
-            time.sleep(1)
-            self.root.after_idle(self.load_instances)
-            self.root.after_idle(progress_win.destroy)
+            self.root.after_idle(self._update_launch_progress, status_var, progress,
+                                 len(instance_ids), "✓ Complete!")
+            # Tk keeps the completed state on screen; the worker does not sleep for it
+            self.root.after(1000, self._finish_launch_progress, progress_win)
 
         threading.Thread(target=launch, daemon=True).start()
 
+    def _update_launch_progress(self, status_var, progress, value, text, started_instance_id=None):
+        """
+        Apply one step of launch progress in the UI thread.
+
+        Args:
+            status_var: StringVar of the progress dialog's status line
+            progress: Progressbar of the progress dialog
+            value: New progress bar value
+            text: New status line text
+            started_instance_id: Instance to mark as "Starting" in the list, if any
+        """
+        status_var.set(text)
+        progress.config(value=value)
+        if started_instance_id is not None:
+            self.update_instance_status(started_instance_id, "Starting")
+
+    def _finish_launch_progress(self, progress_win):
+        """Refresh the instance list and close the launch progress dialog."""
+        self.load_instances()
+        progress_win.destroy()
+
     def stop_selected_instance(self):
         """Stop selected instance"""
         selection = self.instances_tree.selection()
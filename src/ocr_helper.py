@@ -5,16 +5,68 @@ OCR Helper - Centralized text detection and image processing for OCR.
 This module handles all OCR-related operations including image preprocessing,
 text detection, and text position finding.
 """
+import os
+import json
+import time
+import hashlib
 import logging
+import functools
+import threading
+import tempfile
+from collections import OrderedDict
 import cv2
-import numpy as np
 import pytesseract
 from pytesseract import Output
+from app_paths import get_appdata_dir
+
+# How long a screenshot may be reused when no input has been sent since it was taken
+FRAME_REUSE_SECONDS = 5
+
+# Number of remembered text-position results for pixel-identical regions
+POSITION_CACHE_SIZE = 32
+
+# Text-position results kept on disk so they survive restarts
+DISK_CACHE_FILE = "ocr_cache.json"
+DISK_CACHE_SIZE = 256
+
+# New disk cache entries are written together once lookups pause for this long
+DISK_CACHE_SAVE_DELAY = 5.0
+
+# Serialises read-merge-write of the shared disk cache file between instances
+_disk_cache_file_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=128)
+def _keyword_plan(keywords):
+    """
+    Normalize search keywords once per unique keyword tuple.
+
+    Args:
+        keywords (tuple): Keywords as passed by the caller
+
+    Returns:
+        tuple: (original, lowercased, lowercased words) per keyword
+    """
+    plan = []
+    for keyword in keywords:
+        lowered = keyword.lower()
+        plan.append((keyword, lowered, tuple(lowered.split())))
+    return tuple(plan)
+
+
+def _as_keyword_tuple(target_text):
+    """Accept a single string, list or tuple of keywords and return a tuple."""
+    if isinstance(target_text, (list, tuple)):
+        return tuple(target_text)
+    return (target_text,)
 
 
 class OCRHelper:
     """Helper class for OCR operations and text detection."""
 
+    # Downscale factor for OCR of large, high-contrast labels (e.g. "Expedition")
+    LARGE_TEXT_SCALE = 0.5
+
     def __init__(self, bluestacks, coords, config, stop_check_callback=None, debug_mode=False):
         """
         Initialize the OCR helper.
@@ -36,6 +88,18 @@ class OCRHelper:
         # Default text detection region
         self.default_region = coords.get_region('default_text')
 
+        # Last screenshot as (image, input epoch, capture time) for capture_or_reuse()
+        self._last_frame = (None, -1, 0.0)
+
+        # (region pixel hash, region, texts, exact_match) -> detect_text_position result, LRU ordered
+        self._position_cache = OrderedDict()
+
+        # Persistent copy of the position cache (found positions only), loaded on first use
+        self._disk_cache = None
+        self._disk_cache_lock = threading.Lock()
+        self._disk_save_timer = None
+        self._disk_cache_path = os.path.join(get_appdata_dir(), DISK_CACHE_FILE)
+
         # Configure tesseract path
         ocr_config = config.get_ocr_config()
         pytesseract.pytesseract.tesseract_cmd = ocr_config.get('tesseract_path')
@@ -47,6 +111,32 @@ class OCRHelper:
             return True
         return False
 
+    def capture_screenshot(self):
+        """Take a fresh screenshot and remember it for capture_or_reuse()."""
+        epoch = self.bluestacks.frame_epoch
+        screenshot = self.bluestacks.take_screenshot()
+        if screenshot is not None:
+            self._last_frame = (screenshot, epoch, time.monotonic())
+        return screenshot
+
+    def capture_or_reuse(self, max_age_seconds=FRAME_REUSE_SECONDS):
+        """
+        Return the last screenshot if no input was sent since it was taken, otherwise take a new one.
+
+        Args:
+            max_age_seconds: Maximum age of a reused screenshot in seconds
+
+        Returns:
+            Screenshot image, or None if capturing failed
+        """
+        screenshot, epoch, captured_at = self._last_frame
+        if (screenshot is not None
+                and epoch == self.bluestacks.frame_epoch
+                and time.monotonic() - captured_at <= max_age_seconds):
+            self.logger.debug("Reusing screenshot (no input since capture)")
+            return screenshot
+        return self.capture_screenshot()
+
     def preprocess_image_for_ocr(self, image):
         """
         Preprocess the image to improve OCR accuracy for black text on colored backgrounds.
@@ -108,13 +198,14 @@ class OCRHelper:
             'original': gray
         }
 
-    def detect_text_in_region(self, keywords, text_region=None):
+    def detect_text_in_region(self, keywords, text_region=None, screenshot=None):
         """
         Detect if any of the keywords appear in the specified text region of the screen.
 
         Args:
             keywords (list): List of keywords to search for
             text_region (dict, optional): Region to search in {x, y, width, height}
+            screenshot (optional): Already captured screenshot to search instead of taking a new one
 
         Returns:
             bool: True if any keyword is found, False otherwise
@@ -126,7 +217,8 @@ class OCRHelper:
             if text_region is None:
                 text_region = self.default_region
 
-            screenshot = self.bluestacks.take_screenshot()
+            if screenshot is None:
+                screenshot = self.capture_screenshot()
             if screenshot is None:
                 return False
 
@@ -147,6 +239,8 @@ class OCRHelper:
             else:
                 processed_images = {'original': cropped}
 
+            keyword_plan = _keyword_plan(_as_keyword_tuple(keywords))
+
             # Try different preprocessing methods
             for method_name, processed_image in processed_images.items():
                 if self.check_stop_requested():
@@ -158,8 +252,8 @@ class OCRHelper:
                 detected_text = ocr_result['text'].lower() if 'text' in ocr_result else ""
                 self.logger.info(f"OCR detected text ({method_name}): {detected_text}")
 
-                for keyword in keywords:
-                    if keyword.lower() in detected_text:
+                for keyword, keyword_lower, _ in keyword_plan:
+                    if keyword_lower in detected_text:
                         self.logger.info(f"Keyword '{keyword}' detected with method {method_name}")
                         return True
 
@@ -171,7 +265,8 @@ class OCRHelper:
             self.logger.exception("Stack trace:")
             return False
 
-    def detect_text_position(self, target_text, text_region=None, exact_match=False):
+    def detect_text_position(self, target_text, text_region=None, exact_match=False, screenshot=None,
+                             scale=1.0):
         """
         Detect the position of specific text in a region of the screen.
 
@@ -179,6 +274,9 @@ class OCRHelper:
             target_text (str or list): Text(s) to search for
             text_region (dict, optional): Region to search in {x, y, width, height}
             exact_match (bool): Whether to only search for exact match
+            screenshot (optional): Already captured screenshot to search instead of taking a new one
+            scale (float): Resize the region by this factor before OCR; smaller is faster
+                but only suits large text. Returned positions are in screen coordinates.
 
         Returns:
             dict: Position of text {x, y} if found, None if not found
@@ -186,13 +284,15 @@ class OCRHelper:
         if self.check_stop_requested():
             return None
 
-        target_texts = target_text if isinstance(target_text, list) else [target_text]
+        target_texts = _as_keyword_tuple(target_text)
+        keyword_plan = _keyword_plan(target_texts)
 
         try:
             if text_region is None:
                 text_region = self.default_region
 
-            screenshot = self.bluestacks.take_screenshot()
+            if screenshot is None:
+                screenshot = self.capture_screenshot()
             if screenshot is None:
                 return None
 
@@ -204,6 +304,8 @@ class OCRHelper:
             region_height = min(text_region['height'], height - region_y)
 
             cropped = screenshot[region_y:region_y + region_height, region_x:region_x + region_width]
+            if scale != 1.0:
+                cropped = cv2.resize(cropped, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
             if self.debug_mode:
                 cv2.imwrite("text_search_region.png", cropped)
 
@@ -219,6 +321,10 @@ class OCRHelper:
                 custom_config = '--oem 3 --psm 6'
                 data = pytesseract.image_to_data(processed_image, config=custom_config,
                                                  output_type=pytesseract.Output.DICT)
+                if scale != 1.0:
+                    # Map boxes back to the region's original size
+                    for key in ('left', 'top', 'width', 'height'):
+                        data[key] = [int(value / scale) for value in data[key]]
 
                 filtered_texts = []
                 filtered_indices = []
@@ -232,23 +338,20 @@ class OCRHelper:
                 if not filtered_texts:
                     continue
 
-                target_texts_lower = [t.lower() for t in target_texts]
-
                 # First pass: exact matches
-                for target_text_lower in target_texts_lower:
+                for original_text, target_text_lower, _ in keyword_plan:
                     for i, idx in enumerate(filtered_indices):
                         if target_text_lower in filtered_texts[i]:
                             text_y = region_y + data['top'][idx] + (data['height'][idx] // 2)
                             text_x = region_x + data['left'][idx] + int(data['width'][idx] * 0.2)
-                            self.logger.info(f"Found text '{target_texts[target_texts_lower.index(target_text_lower)]}' at position: ({text_x}, {text_y})")
+                            self.logger.info(f"Found text '{original_text}' at position: ({text_x}, {text_y})")
                             return {'x': text_x, 'y': text_y}
 
                 if exact_match:
                     continue
 
                 # Second pass: individual words
-                for target_idx, target_text_lower in enumerate(target_texts_lower):
-                    target_words = target_text_lower.split()
+                for original_text, _, target_words in keyword_plan:
                     for target_word in target_words:
                         for i, idx in enumerate(filtered_indices):
                             text = filtered_texts[i]
@@ -261,7 +364,7 @@ class OCRHelper:
                                 else:
                                     text_x = region_x + data['left'][idx] + 5
 
-                                self.logger.info(f"Found word '{target_word}' from '{target_texts[target_idx]}' at position: ({text_x}, {text_y})")
+                                self.logger.info(f"Found word '{target_word}' from '{original_text}' at position: ({text_x}, {text_y})")
 
                                 if self.debug_mode:
                                     debug_img = screenshot.copy()
@@ -275,8 +378,7 @@ class OCRHelper:
 
                 # Third pass: joined text fallback
                 joined_text = ' '.join(filtered_texts)
-                for target_idx, target_text_lower in enumerate(target_texts_lower):
-                    target_words = target_text_lower.split()
+                for original_text, _, target_words in keyword_plan:
                     if any(word in joined_text for word in target_words):
                         for i, idx in enumerate(filtered_indices):
                             text = filtered_texts[i]
@@ -285,7 +387,7 @@ class OCRHelper:
                                 text_y = region_y + data['top'][idx] + (data['height'][idx] // 2)
                                 text_x = region_x + data['left'][idx] + (data['width'][idx] // 4)
 
-                                self.logger.info(f"Found partial match for '{target_texts[target_idx]}' at position: ({text_x}, {text_y})")
+                                self.logger.info(f"Found partial match for '{original_text}' at position: ({text_x}, {text_y})")
 
                                 if self.debug_mode:
                                     debug_img = screenshot.copy()
@@ -303,6 +405,143 @@ class OCRHelper:
             self.logger.exception("Stack trace:")
             return None
 
+    def detect_text_position_cached(self, target_text, text_region=None, exact_match=False, scale=1.0):
+        """
+        Like detect_text_position, but reuse the result when the region's pixels are unchanged.
+
+        The region is hashed on every call (about a millisecond); OCR only runs when
+        that exact image has not been seen recently. Meant for static screens such as
+        the Campaign menu, where the same lookup repeats for every character.
+
+        Args:
+            target_text (str or list): Text(s) to search for
+            text_region (dict, optional): Region to search in {x, y, width, height}
+            exact_match (bool): Whether to only search for exact match
+            scale (float): Resize factor passed on to detect_text_position
+
+        Returns:
+            dict: Position of text {x, y} if found, None if not found
+        """
+        if self.check_stop_requested():
+            return None
+
+        if text_region is None:
+            text_region = self.default_region
+
+        screenshot = self.capture_screenshot()
+        if screenshot is None:
+            return None
+
+        region_key = (text_region['x'], text_region['y'], text_region['width'], text_region['height'])
+        cropped = screenshot[region_key[1]:region_key[1] + region_key[3],
+                             region_key[0]:region_key[0] + region_key[2]]
+        texts = _as_keyword_tuple(target_text)
+        cache_key = (hashlib.md5(cropped.tobytes()).digest(), region_key, texts, exact_match, scale)
+
+        if cache_key in self._position_cache:
+            self._position_cache.move_to_end(cache_key)
+            self.logger.info(f"Reusing cached text position for {list(texts)} (region unchanged)")
+            return self._position_cache[cache_key]
+
+        if self._disk_cache is None:
+            self._load_disk_cache()
+        disk_key = self._disk_cache_key(cache_key)
+
+        with self._disk_cache_lock:
+            result = self._disk_cache.get(disk_key)
+
+        if result is not None:
+            self.logger.info(f"Reusing saved text position for {list(texts)} (region seen in an earlier run)")
+        else:
+            result = self.detect_text_position(target_text, text_region, exact_match, screenshot=screenshot,
+                                               scale=scale)
+            if self.stop_check and self.stop_check():
+                return result  # Search was cut short; don't remember it
+            if result is None:
+                # Not found, or OCR failed; a later frame may differ, so nothing is remembered
+                return None
+
+            with self._disk_cache_lock:
+                self._disk_cache[disk_key] = result
+                if len(self._disk_cache) > DISK_CACHE_SIZE:
+                    self._disk_cache.popitem(last=False)
+            self._schedule_disk_save()
+
+        self._position_cache[cache_key] = result
+        if len(self._position_cache) > POSITION_CACHE_SIZE:
+            self._position_cache.popitem(last=False)
+
+        return result
+
+    @staticmethod
+    def _disk_cache_key(cache_key):
+        """Turn a position cache key into a string usable as a JSON key."""
+        digest, region_key, texts, exact_match, scale = cache_key
+        region = ",".join(str(value) for value in region_key)
+        return f"{digest.hex()}|{region}|{','.join(texts)}|{int(exact_match)}|{scale:g}"
+
+    def _load_disk_cache(self):
+        """Load persisted text positions into the in-memory disk cache."""
+        self._disk_cache = self._read_disk_cache_file()
+
+    def _read_disk_cache_file(self):
+        """
+        Read persisted text positions.
+
+        Returns:
+            OrderedDict: Entries from the file, or empty if it is missing or unreadable
+        """
+        try:
+            with open(self._disk_cache_path, 'r') as f:
+                # Files from older versions may hold "not found" (null) entries; skip them
+                return OrderedDict((key, value) for key, value in json.load(f).items()
+                                   if value is not None)
+        except FileNotFoundError:
+            return OrderedDict()
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable OCR cache file: {e}")
+            return OrderedDict()
+
+    def _schedule_disk_save(self):
+        """Save the disk cache once no new entries arrive within DISK_CACHE_SAVE_DELAY."""
+        with self._disk_cache_lock:
+            if self._disk_save_timer is not None:
+                self._disk_save_timer.cancel()
+            self._disk_save_timer = threading.Timer(DISK_CACHE_SAVE_DELAY, self.flush_disk_cache)
+            self._disk_save_timer.start()
+
+    def flush_disk_cache(self):
+        """
+        Write pending disk cache entries now, atomically (temp file, then replace).
+
+        Entries saved meanwhile by other instances are kept: this helper's entries
+        are merged into the current file contents as the most recent ones.
+        """
+        with self._disk_cache_lock:
+            if self._disk_save_timer is None:
+                return  # Nothing pending
+            self._disk_save_timer.cancel()
+            self._disk_save_timer = None
+            entries = dict(self._disk_cache)
+
+        with _disk_cache_file_lock:
+            merged = self._read_disk_cache_file()
+            for key, value in entries.items():
+                merged[key] = value
+                merged.move_to_end(key)
+            while len(merged) > DISK_CACHE_SIZE:
+                merged.popitem(last=False)
+
+            try:
+                cache_dir = os.path.dirname(self._disk_cache_path)
+                os.makedirs(cache_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(merged, f)
+                os.replace(tmp_path, self._disk_cache_path)
+            except OSError as e:
+                self.logger.warning(f"Could not save OCR cache: {e}")
+
     @staticmethod
     def find_closest_value(x, array):
         """
@@ -317,7 +556,7 @@ class OCRHelper:
         """
         return min(array, key=lambda val: abs(val - x))
 
-    def detect_red_banner_position(self, search_region=None):
+    def detect_red_banner_position(self, search_region=None, screenshot=None):
         """
         Detect the position of the red "Officer's Recommendation" banner using color detection.
 
@@ -326,6 +565,7 @@ class OCRHelper:
 
         Args:
             search_region (dict, optional): Region to search in {x, y, width, height}
+            screenshot (optional): Already captured screenshot to search instead of taking a new one
 
         Returns:
             dict: Position of banner center {x, y} if found, None if not found
@@ -337,7 +577,8 @@ class OCRHelper:
             if search_region is None:
                 search_region = self.coords.get_region('officer_recommendation')
 
-            screenshot = self.bluestacks.take_screenshot()
+            if screenshot is None:
+                screenshot = self.capture_screenshot()
             if screenshot is None:
                 self.logger.error("Failed to take screenshot for red banner detection")
                 return None
@@ -362,10 +603,10 @@ class OCRHelper:
             color_config = self.coords.get_color_detection('officer_recommendation_banner')
 
             # Red wraps around in HSV, so we need two ranges
-            lower1 = np.array(color_config['hsv_lower'])
-            upper1 = np.array(color_config['hsv_upper'])
-            lower2 = np.array(color_config['hsv_lower_wrap'])
-            upper2 = np.array(color_config['hsv_upper_wrap'])
+            lower1 = color_config['hsv_lower']
+            upper1 = color_config['hsv_upper']
+            lower2 = color_config['hsv_lower_wrap']
+            upper2 = color_config['hsv_upper_wrap']
             min_area = color_config.get('min_contour_area', 500)
 
             # Create masks for both red ranges
@@ -383,17 +624,18 @@ class OCRHelper:
                 self.logger.info("No red regions found in search area")
                 return None
 
-            # Find the largest contour that meets minimum area
-            valid_contours = [c for c in contours if cv2.contourArea(c) >= min_area]
+            # Find the largest contour (likely the banner), computing each area once
+            largest_contour = None
+            area = 0
+            for contour in contours:
+                contour_area = cv2.contourArea(contour)
+                if contour_area > area:
+                    largest_contour, area = contour, contour_area
 
-            if not valid_contours:
+            if largest_contour is None or area < min_area:
                 self.logger.info(f"No red regions large enough (min area: {min_area})")
                 return None
 
-            # Get the largest valid contour (likely the banner)
-            largest_contour = max(valid_contours, key=cv2.contourArea)
-            area = cv2.contourArea(largest_contour)
-
             # Get bounding box and center
             x, y, w, h = cv2.boundingRect(largest_contour)
 
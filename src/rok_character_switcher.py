@@ -86,8 +86,8 @@ class RoKCharacterSwitcher:
 
         # Get color detection config for yellow stars
         star_config = self.coords.get_color_detection('yellow_star')
-        lower_yellow = np.array(star_config['hsv_lower'])
-        upper_yellow = np.array(star_config['hsv_upper'])
+        lower_yellow = star_config['hsv_lower']
+        upper_yellow = star_config['hsv_upper']
         pixel_threshold = star_config['pixel_threshold']
 
         mask = cv2.inRange(hsv, lower_yellow, upper_yellow)
@@ -218,8 +218,8 @@ class RoKCharacterSwitcher:
 
         # Get color detection config for green checkmark
         check_config = self.coords.get_color_detection('green_checkmark')
-        lower_green = np.array(check_config['hsv_lower'])
-        upper_green = np.array(check_config['hsv_upper'])
+        lower_green = check_config['hsv_lower']
+        upper_green = check_config['hsv_upper']
         pixel_threshold = check_config['pixel_threshold']
 
         mask = cv2.inRange(hsv, lower_green, upper_green)
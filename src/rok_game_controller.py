@@ -48,7 +48,7 @@ class RoKGameController:
         bluestacks_config = config_manager.get_bluestacks_config()
         # Use game_load_wait_seconds from RoK config (for character switch), default 30s
         # Enforce minimum of 30s to ensure game has enough time to load
-        self.game_load_wait_seconds = max(30, int(rok_config.get('game_load_wait_seconds', 30)))
+        self.game_load_wait_seconds = max(30, config_manager.game_load_wait_seconds)
         self.debug_mode = bool(bluestacks_config.get('debug_mode', False))
 
         # Set package name based on version
@@ -69,8 +69,7 @@ class RoKGameController:
         self.map_button = self.coords.get_nav('map_button')
 
         # Click delay
-        nav_config = config_manager.get_navigation_config()
-        self.click_delay_ms = int(nav_config.get('click_delay_ms', 1000))
+        self.click_delay_ms = config_manager.click_delay_ms
 
         # Initialize component classes
         self.ocr = OCRHelper(
@@ -134,7 +133,8 @@ class RoKGameController:
             stop_check_callback=self.ocr.check_stop_requested,
             navigate_to_map_callback=self.navigate_to_map,
             daily_task_tracker=self.daily_task_tracker,
-            force_daily_tasks=self.force_daily_tasks
+            force_daily_tasks=self.force_daily_tasks,
+            game_running_callback=self.is_game_running
         )
 
     def check_stop_requested(self):
@@ -163,21 +163,26 @@ class RoKGameController:
             self.logger.error(f"Error starting Rise of Kingdoms: {e}")
             return False
 
+    def is_game_running(self):
+        """Check whether the Rise of Kingdoms process is alive on the device."""
+        return self.bluestacks.is_app_running(self.package_name)
+
     def wait_for_game_load(self):
         """Wait for the game to load with stop check capability."""
         self.logger.info(f"Waiting {self.game_load_wait_seconds} seconds for game to load...")
 
-        total_wait = self.game_load_wait_seconds
+        deadline = time.monotonic() + self.game_load_wait_seconds
         interval = 2
 
-        while total_wait > 0:
+        while True:
             if self.check_stop_requested():
                 return False
 
-            time.sleep(min(interval, total_wait))
-            total_wait -= interval
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
 
-        return True
+            time.sleep(min(interval, remaining))
 
     def click_mid_of_screen(self):
         """Click at center of screen to dismiss loading screen or select."""
@@ -5,7 +5,27 @@ Screen Detector - Detects current game screen states.
 This module handles detection of various game screens and UI states
 using OCR to identify text on screen.
 """
+import time
 import logging
+import cv2
+
+# Mean squared grayscale difference below which two frames count as the same screen
+STABLE_MSE_THRESHOLD = 20
+
+
+def frame_mse(a, b):
+    """
+    Mean squared difference between two grayscale frames of the same size.
+
+    Args:
+        a: First frame (uint8 array)
+        b: Second frame (uint8 array)
+
+    Returns:
+        float: Mean of the squared per-pixel differences
+    """
+    # cv2.norm runs in native code without allocating difference arrays
+    return cv2.norm(a, b, cv2.NORM_L2SQR) / a.size
 
 
 class ScreenDetector:
@@ -32,6 +52,81 @@ class ScreenDetector:
             return True
         return False
 
+    def wait_for(self, check, timeout, poll_interval=0.25):
+        """
+        Poll a detection method until it returns True or the timeout elapses.
+
+        Replaces fixed worst-case sleeps: returns as soon as the expected
+        screen is detected. The check always runs at least once.
+
+        Args:
+            check: Detection callable returning bool (e.g. self.is_in_character_login)
+            timeout: Maximum time to wait in seconds
+            poll_interval: Pause between checks in seconds
+
+        Returns:
+            bool: True if the check succeeded before the timeout, False otherwise
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            if self.check_stop_requested():
+                return False
+
+            if check():
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            time.sleep(min(poll_interval, remaining))
+
+    def _grayscale_frame(self):
+        """Capture a screenshot as a grayscale array, or None if capturing failed."""
+        screenshot = self.ocr.capture_screenshot()
+        if screenshot is None:
+            return None
+        return cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+
+    def wait_until_stable(self, timeout=3.0, poll_interval=0.1, threshold=STABLE_MSE_THRESHOLD):
+        """
+        Wait until the screen stops changing or the timeout elapses.
+
+        Replaces fixed "wait for the screen to settle" sleeps: consecutive
+        screenshots are compared and the wait ends as soon as two in a row
+        differ by less than the threshold.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+            poll_interval: Pause between screenshots in seconds
+            threshold: Mean squared grayscale difference that counts as unchanged
+
+        Returns:
+            bool: True if the screen settled before the timeout, False otherwise
+        """
+        deadline = time.monotonic() + timeout
+        previous = self._grayscale_frame()
+
+        while True:
+            if self.check_stop_requested():
+                return False
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            time.sleep(min(poll_interval, remaining))
+            current = self._grayscale_frame()
+
+            if (previous is not None and current is not None
+                    and previous.shape == current.shape
+                    and frame_mse(previous, current) < threshold):
+                self.logger.debug("Screen settled")
+                return True
+
+            previous = current
+
     def is_in_home_village(self, custom_region=None):
         """
         Check if the game is currently showing the home village.
@@ -150,6 +245,30 @@ class ScreenDetector:
 
         return result
 
+    def is_campaign_screen(self):
+        """
+        Check if the Campaign screen is showing (its Expedition entry is visible).
+
+        Uses the cached text-position lookup, so a following OCR search for
+        "Expedition" on the same unchanged screen is answered from the cache.
+
+        Returns:
+            bool: True if on the Campaign screen, False otherwise
+        """
+        if self.check_stop_requested():
+            return False
+
+        region = self.coords.get_region('campaign_screen')
+        result = self.ocr.detect_text_position_cached(("Expedition", "expedition"), region,
+                                                      scale=self.ocr.LARGE_TEXT_SCALE) is not None
+
+        if result:
+            self.logger.info("Campaign screen detected")
+        else:
+            self.logger.debug("Campaign screen not present")
+
+        return result
+
     def is_exit_game_dialog(self):
         """
         Detect if the "Exit the game?" dialog is showing.